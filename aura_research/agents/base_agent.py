@@ -6,10 +6,11 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, List
 from datetime import datetime
 import asyncio
+import time
 from enum import Enum
 
 
-class AgentStatus(Enum):
+class AgentStatus(str, Enum):
     """Agent execution status"""
     IDLE = "idle"
     RUNNING = "running"
@@ -54,6 +55,8 @@ class BaseAgent(ABC):
         """
         self.status = AgentStatus.RUNNING
         self.start_time = datetime.now()
+        # Durations come from the monotonic clock; datetimes are kept for reporting
+        started = time.perf_counter()
 
         try:
             self.result = await self.run(task)
@@ -65,7 +68,7 @@ class BaseAgent(ABC):
                 "agent_name": self.name,
                 "status": self.status.value,
                 "result": self.result,
-                "execution_time": (self.end_time - self.start_time).total_seconds(),
+                "execution_time": time.perf_counter() - started,
                 "timestamp": self.end_time.isoformat()
             }
 
@@ -79,7 +82,7 @@ class BaseAgent(ABC):
                 "agent_name": self.name,
                 "status": self.status.value,
                 "error": self.error,
-                "execution_time": (self.end_time - self.start_time).total_seconds(),
+                "execution_time": time.perf_counter() - started,
                 "timestamp": self.end_time.isoformat()
             }
 
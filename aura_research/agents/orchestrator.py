@@ -7,9 +7,9 @@ import asyncio
 from .supervisor_agent import SupervisorAgent
 from .summarizer_agent import SummarizerAgent
 from .workflow import ResearchWorkflow
-import json
 from pathlib import Path
 from ..utils.config import ANALYSIS_DIR
+from ..utils.json_utils import dumps_bytes, loads
 
 
 class AgentOrchestrator:
@@ -74,8 +74,8 @@ class AgentOrchestrator:
         # Save to analysis directory
         output_file = Path(ANALYSIS_DIR) / f"research_{session_id}.json"
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        # Serialize once and write the whole document in a single call
+        output_file.write_bytes(dumps_bytes(result, indent=True))
 
         print(f"[Orchestrator] Results saved to: {output_file}")
 
@@ -96,8 +96,7 @@ class AgentOrchestrator:
         if not result_file.exists():
             raise FileNotFoundError(f"Session {session_id} not found")
 
-        with open(result_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return loads(result_file.read_bytes())
 
     async def get_agent_status(self) -> Dict[str, Any]:
         """
@@ -138,6 +137,9 @@ async def run_research(query: str) -> Dict[str, Any]:
 # CLI entry point for testing
 if __name__ == "__main__":
     import sys
+    from ..utils.console import configure_utf8_stdout
+
+    configure_utf8_stdout()
 
     if len(sys.argv) < 2:
         print("Usage: python orchestrator.py <research_query>")
@@ -3,88 +3,61 @@ Subordinate (Analyst) Agent for AURA
 Analyzes assigned research papers and extracts key information
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import asyncio
+import hashlib
 import logging
-from langchain_openai import ChatOpenAI
+import random
 from langchain_core.prompts import ChatPromptTemplate
 from openai import RateLimitError, APIError
 from .base_agent import BaseAgent, AgentStatus
-from ..utils.config import OPENAI_API_KEY, GPT_MODEL, LLM_CALL_TIMEOUT
-import json
+from ..utils.config import (
+    LLM_CALL_TIMEOUT,
+    MAX_CONCURRENT_ANALYSES, PAPERS_PER_ANALYSIS_CALL,
+    MIN_SNIPPET_LENGTH_FOR_ANALYSIS
+)
+from ..utils.json_utils import loads
+from ..utils.llm_cache import LLMCache
+from ..utils.llm_client import get_llm
 
 # Setup logger
 logger = logging.getLogger('aura.agents')
 
 # Rate limit retry configuration
 MAX_RETRIES = 3
-BASE_WAIT_TIME = 60  # seconds
+BASE_WAIT_TIME = 10  # seconds, first rate-limit backoff ceiling (doubles per attempt)
+API_ERROR_WAIT_TIME = 5  # seconds, first API-error backoff ceiling (doubles per attempt)
+MAX_WAIT_TIME = 60  # seconds, upper bound on any single retry delay (reached after a few doublings)
 
 
-class SubordinateAgent(BaseAgent):
-    """
-    Analyst agent that independently analyzes research papers
+def _backoff_delay(attempt: int, base: float, error: Optional[Exception] = None) -> float:
     """
+    Seconds to wait before retrying a failed LLM call
 
-    def __init__(self, agent_id: str):
-        super().__init__(
-            agent_id=agent_id,
-            name=f"Analyst-{agent_id}"
-        )
-        self.llm = ChatOpenAI(
-            model=GPT_MODEL,
-            api_key=OPENAI_API_KEY,
-            temperature=0.2  # Lower for more precision and consistency
-        )
-
-    async def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Analyze assigned research papers
+    Honors the server's Retry-After header when present; otherwise uses exponential
+    backoff with full jitter so concurrent analysts don't retry in lockstep.
+    Either way the delay never exceeds MAX_WAIT_TIME.
 
-        Args:
-            task: Contains 'papers' (list of paper data)
-
-        Returns:
-            Structured analysis in JSON format
-        """
-        papers = task.get("papers", [])
-
-        if not papers:
-            return {
-                "agent_id": self.agent_id,
-                "analysis": [],
-                "summary": "No papers assigned"
-            }
+    Args:
+        attempt: Zero-based attempt that just failed
+        base: Backoff ceiling for the first retry
+        error: The OpenAI error, if any
 
-        # Analyze each paper
-        analyses = []
-        for paper in papers:
-            analysis = await self._analyze_paper(paper)
-            analyses.append(analysis)
-
-        # Create aggregate summary
-        summary = await self._create_summary(analyses)
-
-        return {
-            "agent_id": self.agent_id,
-            "papers_analyzed": len(papers),
-            "analyses": analyses,
-            "summary": summary
-        }
-
-    async def _analyze_paper(self, paper: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Analyze a single research paper using ReAct framework
+    Returns:
+        Delay in seconds
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after) + random.uniform(0, 1), MAX_WAIT_TIME)
+        except ValueError:
+            pass
+    return random.uniform(0, min(base * (2 ** attempt), MAX_WAIT_TIME))
 
-        Args:
-            paper: Paper metadata (title, snippet, link, etc.)
 
-        Returns:
-            Structured analysis with summary, key_points, and citations
-        """
-        # ReAct Framework: Reasoning + Acting
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an ELITE research analyst with PhD-level expertise. Your analysis must be METICULOUS, PRECISE, and SUBSTANTIVE.
+# Shared by the single-paper and multi-paper analysis prompts
+ANALYST_SYSTEM_PROMPT = """You are an ELITE research analyst with PhD-level expertise. Your analysis must be METICULOUS, PRECISE, and SUBSTANTIVE.
 
 CRITICAL REQUIREMENTS:
 1. NEVER use generic placeholders like "Main contribution 1" or "Key finding 1"
@@ -121,8 +94,12 @@ OUTPUT REQUIREMENTS:
 - Key Points: 5-7 SPECIFIC insights (not generic templates)
 - Each point must reference actual content from the abstract
 - Use scholarly language with precision
-- Extract author names and publication year if mentioned ANYWHERE in the text"""),
-            ("user", """ANALYZE THIS RESEARCH PAPER WITH EXTREME PRECISION:
+- Extract author names and publication year if mentioned ANYWHERE in the text"""
+
+# Prompt templates are input-independent, so they are built once at import
+ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", ANALYST_SYSTEM_PROMPT),
+    ("user", """ANALYZE THIS RESEARCH PAPER WITH EXTREME PRECISION:
 
 ═══════════════════════════════════════════════════════════
 TITLE: {title}
@@ -203,8 +180,178 @@ CRITICAL REMINDERS:
 - Use exact terminology from the paper
 - Be scholarly and precise
 - Quality and accuracy over everything else""")
-        ])
+])
+
+BATCH_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", ANALYST_SYSTEM_PROMPT),
+    ("user", """ANALYZE EACH OF THE FOLLOWING {count} RESEARCH PAPERS WITH EXTREME PRECISION:
+
+{papers}
+
+Apply the full THOUGHT / ACTION / OBSERVATION / REFLECTION analysis to EACH paper independently.
+Never mix information between papers - every field must come from that paper's own abstract.
+
+OUTPUT A SINGLE JSON OBJECT IN THIS EXACT FORMAT:
+{{
+    "analyses": [
+        {{
+            "paper_index": 1,
+            "summary": "A detailed 3-4 sentence scholarly summary: specific problem, methods, key findings, significance. ONLY information from the abstract.",
+            "key_points": ["5-7 SPECIFIC contributions, techniques, results, novelties, applications and limitations from the abstract"],
+            "citations": [
+                {{
+                    "title": "Exact paper title",
+                    "authors": "Extract from title format OR publication info OR 'Information not provided in abstract'",
+                    "year": "Extract from publication info OR title OR 'Information not provided in abstract'",
+                    "source": "Paper source URL"
+                }}
+            ],
+            "metadata": {{
+                "core_ideas": ["Specific idea 1 from paper", "Specific idea 2 from paper", "Specific idea 3 from paper"],
+                "methodology": "Detailed description of the EXACT methods/approach mentioned in the abstract",
+                "key_findings": ["Specific finding 1 with details", "Specific finding 2 with details", "Specific finding 3 with details"],
+                "novelty": "Precise description of what is NEW in this work",
+                "limitations": ["Specific limitation 1", "Specific limitation 2", "Specific gap noted"],
+                "relevance_score": (1-10 based on: novelty + methodological rigor + impact + clarity),
+                "reasoning": "Your ReAct thought process for this paper",
+                "research_domain": "Specific field/subfield",
+                "technical_depth": "'theoretical', 'applied', 'empirical', or 'survey'",
+                "real_content_extracted": true
+            }}
+        }}
+    ]
+}}
+
+The "analyses" list MUST contain exactly {count} entries, one per paper, in the same order as the papers above.""")
+])
+
+
+class SubordinateAgent(BaseAgent):
+    """
+    Analyst agent that independently analyzes research papers
+    """
 
+    # Paper analysis cache (shared across agents and runs, keyed by paper identity)
+    ANALYSIS_CACHE_TIMEOUT_HOURS = 24
+    _analysis_cache = LLMCache(ttl_hours=ANALYSIS_CACHE_TIMEOUT_HOURS)
+
+    def __init__(self, agent_id: str):
+        super().__init__(
+            agent_id=agent_id,
+            name=f"Analyst-{agent_id}"
+        )
+        # Shared across analysts (and their connection pool across all agents)
+        self.llm = get_llm(0.2)  # Lower for more precision and consistency
+        # Analysis prompts use JSON mode so responses always parse as a JSON object
+        json_llm = self.llm.bind(response_format={"type": "json_object"})
+        self._analysis_chain = ANALYSIS_PROMPT | json_llm
+        # A multi-paper response is longer, so its requests get twice the client timeout
+        # (a per-request override passed through to the OpenAI SDK)
+        self._batch_analysis_chain = BATCH_ANALYSIS_PROMPT | json_llm.bind(timeout=LLM_CALL_TIMEOUT * 2)
+
+    async def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze assigned research papers
+
+        Args:
+            task: Contains 'papers' (list of paper data)
+
+        Returns:
+            Structured analysis in JSON format
+        """
+        papers = task.get("papers", [])
+
+        if not papers:
+            return {
+                "agent_id": self.agent_id,
+                "analysis": [],
+                "summary": "No papers assigned"
+            }
+
+        # Serve papers analyzed in earlier runs from the cache
+        analyses: List[Optional[Dict[str, Any]]] = [
+            self._get_cached_analysis(paper) for paper in papers
+        ]
+        pending = [paper for paper, analysis in zip(papers, analyses) if analysis is None]
+        if len(pending) < len(papers):
+            logger.info(f"Reusing {len(papers) - len(pending)} cached paper analyses")
+
+        # Analyze each distinct paper once; duplicates in this batch share its analysis
+        pending_keys = [self._analysis_cache_key(paper) for paper in pending]
+        unique_papers: Dict[str, Dict[str, Any]] = {}
+        for key, paper in zip(pending_keys, pending):
+            unique_papers.setdefault(key, paper)
+        if len(unique_papers) < len(pending):
+            logger.info(f"Skipping {len(pending) - len(unique_papers)} duplicate papers in batch")
+
+        # Papers without a usable abstract get a stub instead of an LLM call
+        analyzed: Dict[str, Dict[str, Any]] = {
+            key: self._stub_analysis(paper)
+            for key, paper in unique_papers.items()
+            if not self._has_analyzable_snippet(paper)
+        }
+        if analyzed:
+            logger.info(f"Skipping LLM analysis for {len(analyzed)} papers without a usable abstract")
+        to_analyze_keys = [key for key in unique_papers if key not in analyzed]
+        to_analyze = [unique_papers[key] for key in to_analyze_keys]
+
+        # Group papers per LLM call (groups of one unless multi-paper batching is enabled)
+        group_size = max(1, PAPERS_PER_ANALYSIS_CALL)
+        groups = [to_analyze[i:i + group_size] for i in range(0, len(to_analyze), group_size)]
+
+        # Analyze groups with a fixed pool of workers: at most MAX_CONCURRENT_ANALYSES
+        # calls (and prompts) are in flight, however many papers the batch holds
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, group in enumerate(groups):
+            queue.put_nowait((index, group))
+        results: List[List[Dict[str, Any]]] = [[] for _ in groups]
+
+        async def worker() -> None:
+            while not queue.empty():
+                index, group = queue.get_nowait()
+                try:
+                    if len(group) == 1:
+                        results[index] = [await self._analyze_paper(group[0])]
+                    else:
+                        results[index] = await self._analyze_papers_batch(group)
+                except Exception as e:
+                    logger.error(f"Paper analysis raised: {e}")
+                    results[index] = [self._fallback_analysis(paper, str(e)) for paper in group]
+
+        await asyncio.gather(*(worker() for _ in range(min(MAX_CONCURRENT_ANALYSES, len(groups)))))
+        new_analyses = [analysis for result in results for analysis in result]
+
+        # Fill the uncached slots in paper order (each duplicate gets its own copy)
+        analyzed.update(zip(to_analyze_keys, new_analyses))
+        key_iter = iter(pending_keys)
+        analyses = [
+            analysis if analysis is not None else dict(analyzed[next(key_iter)])
+            for analysis in analyses
+        ]
+
+        # Stitch paper summaries together; the summarizer synthesizes from the analyses
+        # themselves, so a separate LLM summary per analyst would be discarded
+        summary = "; ".join(
+            analysis["summary"] for analysis in analyses if analysis.get("summary")
+        )[:2000]
+
+        return {
+            "agent_id": self.agent_id,
+            "papers_analyzed": len(papers),
+            "analyses": analyses,
+            "summary": summary
+        }
+
+    async def _analyze_paper(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze a single research paper using ReAct framework
+
+        Args:
+            paper: Paper metadata (title, snippet, link, etc.)
+
+        Returns:
+            Structured analysis with summary, key_points, and citations
+        """
         # Retry loop for rate limit handling
         last_error = None
         for attempt in range(MAX_RETRIES):
@@ -212,9 +359,8 @@ CRITICAL REMINDERS:
                 logger.info(f"Analyzing paper: {paper.get('title', 'Unknown')[:50]}...")
 
                 # Run LLM analysis with timeout
-                chain = prompt | self.llm
                 response = await asyncio.wait_for(
-                    chain.ainvoke({
+                    self._analysis_chain.ainvoke({
                         "title": paper.get("title", "Unknown"),
                         "snippet": paper.get("snippet", "No description available"),
                         "link": paper.get("link", ""),
@@ -224,40 +370,14 @@ CRITICAL REMINDERS:
                 )
 
                 # Parse JSON response
-                content = response.content
-
-                # Extract JSON from markdown code blocks if present
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
+                analysis = loads(response.content)
 
-                analysis = json.loads(content)
-
-                # Ensure required structure
+                # Ensure required structure (old-format responses are converted)
                 if "summary" not in analysis:
-                    # Convert old format to new format if needed
-                    analysis = {
-                        "summary": f"Analysis of {paper.get('title', 'Unknown')}",
-                        "key_points": analysis.get("core_ideas", []) + analysis.get("key_findings", []),
-                        "citations": [{
-                            "title": paper.get("title", "Unknown"),
-                            "authors": "Not specified",
-                            "year": "Not specified",
-                            "source": paper.get("link", "")
-                        }],
-                        "metadata": {
-                            "core_ideas": analysis.get("core_ideas", []),
-                            "methodology": analysis.get("methodology", ""),
-                            "key_findings": analysis.get("key_findings", []),
-                            "novelty": analysis.get("novelty", ""),
-                            "limitations": analysis.get("gaps", []),
-                            "relevance_score": analysis.get("relevance_score", 0),
-                            "reasoning": "ReAct framework applied"
-                        }
-                    }
+                    analysis = self._convert_legacy_analysis(paper, analysis)
 
                 logger.info(f"Successfully analyzed paper: {paper.get('title', 'Unknown')[:50]}")
+                self._cache_analysis(paper, analysis)
                 return analysis
 
             except asyncio.TimeoutError as e:
@@ -271,24 +391,28 @@ CRITICAL REMINDERS:
 
             except RateLimitError as e:
                 last_error = e
-                wait_time = BASE_WAIT_TIME * (attempt + 1)
-                logger.warning(
-                    f"OpenAI rate limit hit (attempt {attempt + 1}/{MAX_RETRIES}). "
-                    f"Waiting {wait_time}s before retry..."
-                )
-                await asyncio.sleep(wait_time)
+                if attempt < MAX_RETRIES - 1:
+                    wait_time = _backoff_delay(attempt, BASE_WAIT_TIME, e)
+                    logger.warning(
+                        f"OpenAI rate limit hit (attempt {attempt + 1}/{MAX_RETRIES}). "
+                        f"Waiting {wait_time:.1f}s before retry..."
+                    )
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.warning(f"OpenAI rate limit hit on final attempt ({MAX_RETRIES}/{MAX_RETRIES})")
 
             except APIError as e:
                 last_error = e
                 logger.error(f"OpenAI API error: {e}")
                 if attempt < MAX_RETRIES - 1:
-                    wait_time = 10 * (attempt + 1)
-                    logger.info(f"Retrying in {wait_time}s...")
+                    wait_time = _backoff_delay(attempt, API_ERROR_WAIT_TIME, e)
+                    logger.info(f"Retrying in {wait_time:.1f}s...")
                     await asyncio.sleep(wait_time)
                 else:
                     break
 
-            except json.JSONDecodeError as e:
+            except ValueError as e:
+                # json and orjson decode errors both subclass ValueError
                 last_error = e
                 logger.warning(f"JSON parsing error: {e}. Retrying...")
                 if attempt < MAX_RETRIES - 1:
@@ -305,6 +429,176 @@ CRITICAL REMINDERS:
         error_msg = str(last_error) if last_error else "Unknown error"
         logger.error(f"Failed to analyze paper after {MAX_RETRIES} attempts: {error_msg}")
 
+        return self._fallback_analysis(paper, error_msg)
+
+    async def _analyze_papers_batch(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several papers in a single LLM call
+
+        The analyst system prompt and output schema are sent once for the
+        whole group instead of once per paper. If the combined response
+        cannot be used, each paper is analyzed individually instead.
+
+        Args:
+            papers: Group of paper metadata dicts
+
+        Returns:
+            One analysis per paper, in input order
+        """
+        paper_blocks = []
+        for i, paper in enumerate(papers, 1):
+            paper_blocks.append(
+                f"═══════════════ PAPER {i} ═══════════════\n"
+                f"TITLE: {paper.get('title', 'Unknown')}\n\n"
+                f"ABSTRACT/DESCRIPTION: {paper.get('snippet', 'No description available')}\n\n"
+                f"SOURCE URL: {paper.get('link', '')}\n\n"
+                f"PUBLICATION INFO: {paper.get('publication_info', '')}"
+            )
+
+        try:
+            logger.info(f"Analyzing batch of {len(papers)} papers in one call...")
+            response = await self._batch_analysis_chain.ainvoke({
+                "count": len(papers),
+                "papers": "\n\n".join(paper_blocks)
+            })
+
+            analyses = loads(response.content).get("analyses", [])
+            if len(analyses) != len(papers) or not all("summary" in a for a in analyses):
+                raise ValueError(
+                    f"Expected {len(papers)} analyses with summaries, got {len(analyses)}"
+                )
+
+            logger.info(f"Successfully analyzed batch of {len(papers)} papers")
+            for paper, analysis in zip(papers, analyses):
+                self._cache_analysis(paper, analysis)
+            return analyses
+
+        except Exception as e:
+            logger.warning(f"Batch analysis failed ({e}). Falling back to per-paper analysis...")
+            return [await self._analyze_paper(paper) for paper in papers]
+
+    @staticmethod
+    def _analysis_cache_key(paper: Dict[str, Any]) -> str:
+        """Stable cache key for a paper: its URL, or title + snippet when no URL is known"""
+        identity = paper.get("link") or f"{paper.get('title', '')}\x00{paper.get('snippet', '')}"
+        return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _get_cached_analysis(self, paper: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a previous analysis of this paper
+
+        Args:
+            paper: Paper metadata
+
+        Returns:
+            Copy of the cached analysis, or None if missing or expired
+        """
+        cached = self._analysis_cache.get(self._analysis_cache_key(paper))
+        return dict(cached) if cached is not None else None
+
+    def _cache_analysis(self, paper: Dict[str, Any], analysis: Dict[str, Any]) -> None:
+        """
+        Cache a successful analysis
+
+        Args:
+            paper: Paper metadata
+            analysis: Parsed analysis for the paper
+        """
+        self._analysis_cache.set(self._analysis_cache_key(paper), analysis)
+
+    @staticmethod
+    def _has_analyzable_snippet(paper: Dict[str, Any]) -> bool:
+        """Whether the paper's snippet carries enough text to be worth an LLM analysis"""
+        snippet = (paper.get("snippet") or "").strip()
+        return (
+            len(snippet) >= MIN_SNIPPET_LENGTH_FOR_ANALYSIS
+            and snippet.lower() != "no description available"
+        )
+
+    def _stub_analysis(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the analysis for a paper whose abstract is too short to analyze
+
+        Args:
+            paper: Paper metadata
+
+        Returns:
+            Analysis-shaped dict built from the metadata alone, with relevance 0
+        """
+        snippet = (paper.get("snippet") or "").strip()
+        title = paper.get("title", "Unknown")
+        # Take authors and year from the search metadata, as the LLM path is told to
+        pub_info = paper.get("publication_info") or {}
+        if not isinstance(pub_info, dict):
+            pub_info = {}
+        authors = str(pub_info.get("authors") or "").strip()
+        year = str(pub_info.get("year") or paper.get("year") or "").strip()
+        return {
+            "summary": snippet or f"No abstract available for {title}.",
+            "key_points": [],
+            "citations": [{
+                "title": title,
+                "authors": authors or "Information not provided in abstract",
+                "year": year or "Information not provided in abstract",
+                "source": paper.get("link", "")
+            }],
+            "metadata": {
+                "core_ideas": [],
+                "methodology": "Information not provided in abstract",
+                "key_findings": [],
+                "novelty": "Information not provided in abstract",
+                "limitations": ["Abstract too short to analyze"],
+                "relevance_score": 0,
+                "reasoning": "Skipped LLM analysis: abstract/snippet too short",
+                "real_content_extracted": False
+            }
+        }
+
+    @staticmethod
+    def _convert_legacy_analysis(paper: Dict[str, Any], legacy: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert an old-format analysis (flat core_ideas/key_findings, no summary) to the current format
+
+        Args:
+            paper: Paper metadata
+            legacy: Parsed old-format LLM response
+
+        Returns:
+            Analysis with summary, key_points, citations and metadata
+        """
+        core_ideas = legacy.get("core_ideas", [])
+        key_findings = legacy.get("key_findings", [])
+        return {
+            "summary": f"Analysis of {paper.get('title', 'Unknown')}",
+            "key_points": core_ideas + key_findings,
+            "citations": [{
+                "title": paper.get("title", "Unknown"),
+                "authors": "Not specified",
+                "year": "Not specified",
+                "source": paper.get("link", "")
+            }],
+            "metadata": {
+                "core_ideas": core_ideas,
+                "methodology": legacy.get("methodology", ""),
+                "key_findings": key_findings,
+                "novelty": legacy.get("novelty", ""),
+                "limitations": legacy.get("gaps", []),
+                "relevance_score": legacy.get("relevance_score", 0),
+                "reasoning": "ReAct framework applied"
+            }
+        }
+
+    def _fallback_analysis(self, paper: Dict[str, Any], error_msg: str) -> Dict[str, Any]:
+        """
+        Build the placeholder analysis returned when a paper could not be analyzed
+
+        Args:
+            paper: Paper metadata
+            error_msg: Reason the analysis failed
+
+        Returns:
+            Analysis-shaped dict flagged with the error
+        """
         return {
             "summary": f"Unable to fully analyze: {paper.get('title', 'Unknown')}. Error: {error_msg}",
             "key_points": [
@@ -328,74 +622,3 @@ CRITICAL REMINDERS:
                 "error": error_msg
             }
         }
-
-    async def _create_summary(self, analyses: List[Dict[str, Any]]) -> str:
-        """
-        Create summary of all analyzed papers
-
-        Args:
-            analyses: List of paper analyses
-
-        Returns:
-            Concise summary text
-        """
-        if not analyses:
-            return "No analyses to summarize"
-
-        summary_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a SENIOR research synthesizer with exceptional analytical skills.
-
-Your summary must be:
-- SPECIFIC and detailed (not generic)
-- Based ONLY on actual findings from the analyses
-- Scholarly and precise
-- Comprehensive yet concise"""),
-            ("user", """SYNTHESIZE these paper analyses into a comprehensive summary:
-
-{analyses}
-
-REQUIREMENTS:
-1. Identify 3-5 SPECIFIC common themes across papers (use actual terminology from papers)
-2. Highlight major CONCRETE contributions (not generic statements)
-3. Note methodological patterns with specific examples
-4. Identify research gaps or contradictions
-5. Write 4-6 sentences that demonstrate deep understanding
-
-Focus on SUBSTANCE - what did you actually learn from these papers?
-Use precise language and specific examples from the analyses.""")
-        ])
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                chain = summary_prompt | self.llm
-                response = await asyncio.wait_for(
-                    chain.ainvoke({
-                        "analyses": json.dumps(analyses, indent=2)
-                    }),
-                    timeout=LLM_CALL_TIMEOUT
-                )
-
-                logger.info(f"Successfully created summary for {len(analyses)} analyses")
-                return response.content.strip()
-
-            except asyncio.TimeoutError as e:
-                logger.error(f"Summary LLM call timed out after {LLM_CALL_TIMEOUT}s")
-                if attempt < MAX_RETRIES - 1:
-                    logger.info(f"Retrying summary generation...")
-                    await asyncio.sleep(2)
-                else:
-                    break
-
-            except RateLimitError as e:
-                wait_time = BASE_WAIT_TIME * (attempt + 1)
-                logger.warning(
-                    f"Rate limit hit during summary (attempt {attempt + 1}/{MAX_RETRIES}). "
-                    f"Waiting {wait_time}s..."
-                )
-                await asyncio.sleep(wait_time)
-
-            except Exception as e:
-                logger.error(f"Summary generation failed: {e}")
-                return f"Summary generation failed: {str(e)}"
-
-        return "Summary generation failed after maximum retries"
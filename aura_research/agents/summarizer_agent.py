@@ -3,15 +3,15 @@ Summarizer Agent for AURA
 Synthesizes subordinate agent outputs into a cohesive research essay
 """
 
-from typing import Dict, Any, List
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional, Tuple
 from langchain_core.prompts import ChatPromptTemplate
 from .base_agent import BaseAgent
 from ..utils.config import (
-    OPENAI_API_KEY, GPT_MODEL, ESSAYS_DIR,
+    GPT_MODEL, CONCLUSION_MODEL, ESSAYS_DIR,
     MIN_QUALITY_SCORE, MAX_ESSAY_REGENERATION_ATTEMPTS,
     MIN_CITATION_ACCURACY, MIN_SUPPORTED_CLAIMS_PCT,
-    LLM_CALL_TIMEOUT, GRACEFUL_DEGRADATION_THRESHOLD
+    LLM_CALL_TIMEOUT, GRACEFUL_DEGRADATION_THRESHOLD,
+    SYNTHESIS_MAX_INPUT_TOKENS, SYNTHESIS_MAX_OUTPUT_TOKENS, SECTION_MAX_OUTPUT_TOKENS
 )
 from ..services.quality_scoring_service import QualityScoringService
 from ..services.citation_verification_service import CitationVerificationService
@@ -22,13 +22,326 @@ from ..utils.error_messages import (
     get_fact_check_failed_error,
     get_success_message
 )
-import json
+from ..utils.json_utils import dumps, dumps_bytes, loads
+from ..utils.llm_cache import LLMCache, cache_key, is_cacheable
+from ..utils.llm_client import get_llm
+from ..utils.token_budget import fit_to_token_budget
 from datetime import datetime
 from pathlib import Path
 import asyncio
+import logging
+import os
 import time
-import sys
-import io
+import re
+import traceback
+
+logger = logging.getLogger('aura.summarizer')
+
+# Characters dropped from queries when building essay filenames (keeps letters, digits, spaces, hyphens)
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]|_")
+# Placeholder analysts write for citation fields an abstract does not give
+_NOT_PROVIDED = "Information not provided in abstract"
+
+
+ESSAY_SECTIONS = ("introduction", "body", "conclusion")
+SUMMARIZER_TEMPERATURE = 0.3  # Precise academic tone
+
+# Prompt templates are input-independent, so they are built once at import
+SYNTHESIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a WORLD-CLASS research synthesizer with expertise in meta-analysis and systematic reviews.
+
+APPLY ReAct FRAMEWORK (Reasoning + Acting):
+
+STEP 1 - THOUGHT: What patterns emerge across all papers? What are the recurring themes?
+STEP 2 - ACTION: Extract specific themes, methodologies, findings from each paper systematically
+STEP 3 - OBSERVATION: Note agreements, conflicts, and progressions in the field
+STEP 4 - REFLECTION: What does the collective evidence suggest? What remains unknown?
+
+CRITICAL REQUIREMENTS:
+1. Extract SPECIFIC themes using actual terminology from the papers
+2. Identify CONCRETE methodologies with precise names (algorithms, frameworks, techniques)
+3. Synthesize SUBSTANTIVE findings (not generic statements)
+4. Be scholarly, precise, and insightful
+5. Think like a senior researcher conducting a literature review
+
+Your synthesis will guide the final essay - make it exceptional."""),
+    ("user", """CONDUCT A COMPREHENSIVE SYNTHESIS OF RESEARCH FINDINGS
+
+Research Query: {query}
+Number of Papers: {count}
+
+═══════════════════════════════════════════════════════════
+PAPER ANALYSES:
+{analyses}
+═══════════════════════════════════════════════════════════
+
+APPLY REACT REASONING:
+
+THOUGHT: Examine all papers. What patterns appear? What methodologies recur? What findings repeat?
+
+ACTION: For each paper, extract:
+  - Main themes and terminology used
+  - Specific methods, algorithms, frameworks employed
+  - Key results and metrics
+  - Limitations noted
+  - Future work suggested
+
+OBSERVATION: Compare across papers:
+  - Which findings are consistent across studies?
+  - Where do papers conflict or diverge?
+  - What methodological approaches dominate?
+  - What are common research gaps?
+
+SYNTHESIS REQUIREMENTS:
+
+1. MAIN THEMES (5-8 themes):
+   - Identify SPECIFIC recurring topics using exact terminology from papers
+   - Example: "Transformer-based architectures for sequence modeling" NOT "deep learning methods"
+   - Each theme should be substantive and precise
+
+2. METHODOLOGIES (5-10 specific methods):
+   - List EXACT methods, algorithms, frameworks mentioned
+   - Examples: "BERT fine-tuning", "Proximal Policy Optimization", "Variational Autoencoders"
+   - NOT generic like "machine learning approaches"
+
+3. KEY FINDINGS (8-12 findings):
+   - Extract SPECIFIC discoveries, improvements, or insights
+   - Include metrics if mentioned (e.g., "achieved 95% accuracy on ImageNet")
+   - Each finding should be concrete and informative
+
+4. CONTRADICTIONS (if any):
+   - Identify where papers disagree or present conflicting results
+   - Be specific about what conflicts and why
+
+5. RESEARCH GAPS (3-7 gaps):
+   - What questions remain unanswered?
+   - What limitations were noted?
+   - What future work was suggested?
+
+6. TOP CONTRIBUTIONS (5-8 contributions):
+   - What are the most significant advances from these papers?
+   - What novel techniques or insights were introduced?
+   - What practical applications were demonstrated?
+
+OUTPUT IN PRECISE JSON FORMAT:
+{{
+    "main_themes": ["Specific theme 1 with technical detail", "Specific theme 2...", ...],
+    "methodologies": ["Exact method 1", "Exact algorithm 2", "Specific framework 3", ...],
+    "key_findings": ["Concrete finding 1 with details", "Specific result 2", ...],
+    "contradictions": ["Specific contradiction 1 if found", ...],
+    "research_gaps": ["Specific gap 1", "Unanswered question 2", ...],
+    "top_contributions": ["Major contribution 1 with specifics", "Novel technique 2", ...]
+}}
+
+CRITICAL: Every item must be SPECIFIC and SUBSTANTIVE. No generic placeholders.""")
+])
+
+INTRODUCTION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a senior research scientist writing a literature review for a peer-reviewed journal.
+Your prose is clear, precise, and evidence-based. Use formal academic English, passive voice
+where appropriate, hedged claims, and specific citations in (Author et al., Year) format.
+Do not use flowery or philosophical language. Be direct, scholarly, and rigorous.
+
+APPLY REACT THINKING:
+THOUGHT: What is the research context? What papers establish foundational knowledge?
+ACTION: Select 2-3 key papers that introduce the domain. Extract their core contributions.
+OBSERVATION: What is the state of knowledge that these papers establish?
+REFLECTION: What narrative connects these papers to justify this literature review?
+
+CRITICAL ACADEMIC INTEGRITY REQUIREMENTS:
+1. EVERY factual claim MUST be supported by specific citations
+2. Use ONLY information available in the provided paper references
+3. If you cannot find supporting evidence, DO NOT include it
+4. Use hedging language: "suggests", "may indicate", "appears to"
+5. Never extrapolate beyond what papers explicitly state
+6. Citation format MUST be (Author et al., Year) with exact author names
+7. Do not invent or approximate citations
+8. If references are insufficient, state this clearly rather than generating unsupported content"""),
+    ("user", """Write the INTRODUCTION for a literature review on the following topic.
+
+TOPIC: {query}
+NUMBER OF PAPERS REVIEWED: {count}
+
+PAPER REFERENCES (use ONLY these for citations - do not cite papers not in this list):
+{paper_references}
+
+THEMES IDENTIFIED:
+{themes}
+
+STRUCTURE (2 paragraphs, 150-250 words total):
+
+PARAGRAPH 1 - RESEARCH CONTEXT AND SIGNIFICANCE:
+- Introduce the research domain and its importance
+- Cite 2-3 specific papers from the references using (Author et al., Year) format
+- Establish the current state of knowledge
+
+PARAGRAPH 2 - SCOPE OF THIS REVIEW:
+- State the number of papers reviewed
+- Preview the major themes that will be discussed
+- Briefly outline the structure of the review
+
+CRITICAL REQUIREMENTS:
+- Every claim must be traceable to a specific paper
+- Keep within 150-250 words""")
+])
+
+BODY_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a senior research scientist writing the body of a literature review for a peer-reviewed journal.
+Organize the review thematically. For each theme, cite specific papers using (Author et al., Year) format.
+Compare and contrast findings across studies. Note methodological differences.
+Use formal academic English, passive voice where appropriate, and hedged claims.
+Do not use flowery or philosophical language. Be direct, scholarly, and analytical.
+
+APPLY REACT THINKING:
+THOUGHT: Which papers address each theme? What are the key variations in approach or findings?
+ACTION: For each theme, identify 2-4 papers. Extract their methods and results with citations.
+OBSERVATION: How do the findings align or diverge? What methodological differences explain variations?
+REFLECTION: What synthesis of these papers reveals about the theme's current state of knowledge?
+
+CRITICAL ACADEMIC INTEGRITY REQUIREMENTS:
+1. EVERY claim about research findings MUST cite specific papers
+2. Use ONLY papers from the provided references - do not reference papers not in the list
+3. When comparing studies, cite each study explicitly
+4. When noting differences, show them with explicit citations
+5. Use hedging language: "suggests", "may indicate", "appears", "indicates"
+6. Do not extrapolate beyond what papers state
+7. Citation format MUST be (Author et al., Year) - match reference list exactly
+8. If you cannot support a claim with provided papers, omit it
+9. For methodological analysis, explicitly compare approaches using citations"""),
+    ("user", """Write the BODY of a literature review.
+
+PAPER REFERENCES (use ONLY these for citations - do not cite papers not in this list):
+{paper_references}
+
+THEMES TO COVER:
+{themes}
+
+KEY FINDINGS:
+{findings}
+
+METHODOLOGIES USED:
+{methodologies}
+
+RESEARCH GAPS:
+{gaps}
+
+TOP CONTRIBUTIONS:
+{contributions}
+
+NUMBER OF PAPERS: {count}
+
+STRUCTURE (4-6 paragraphs, 600-900 words total):
+
+Organize by theme. For each major theme:
+- Introduce the theme and its relevance to the research question
+- Cite 2-4 specific papers by (Author et al., Year) from the references above
+- Compare and contrast findings across the cited studies with explicit citations
+- Note methodological differences between approaches with citations
+- Synthesize what the collective evidence suggests (with citations)
+
+CRITICAL REQUIREMENTS:
+- Compare and contrast - do not just summarize papers sequentially
+- Note areas of agreement and disagreement with explicit citations
+- Use transitions between themes
+- Keep within 600-900 words""")
+])
+
+CONCLUSION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a senior research scientist writing the conclusion of a literature review for a peer-reviewed journal.
+Synthesize the key findings concisely, identify limitations and gaps, and suggest future research directions.
+Use formal academic English. Be precise, evidence-based, and forward-looking.
+Do not use flowery or philosophical language.
+
+APPLY REACT THINKING:
+THOUGHT: What are the most significant findings across all papers? What remains unresolved?
+ACTION: Identify 3-4 key findings with citations. List specific gaps and limitations found.
+OBSERVATION: Where does the literature have consensus? Where are gaps most critical?
+REFLECTION: What does the evidence collectively suggest? What future research would address key gaps?
+
+CRITICAL ACADEMIC INTEGRITY REQUIREMENTS:
+1. All major findings cited in synthesis MUST reference specific papers
+2. Limitations MUST be tied to specific studies or gaps in the literature
+3. Future research suggestions MUST connect explicitly to identified gaps
+4. Use ONLY papers from the provided references
+5. Use hedging language: "suggests", "may", "appears", "indicates"
+6. Do not make claims unsupported by the reviewed literature
+7. Citation format MUST be (Author et al., Year)
+8. Acknowledge what the current literature can and cannot conclude"""),
+    ("user", """Write the CONCLUSION for a literature review.
+
+TOPIC: {query}
+
+PAPER REFERENCES (use ONLY these for citations):
+{paper_references}
+
+KEY THEMES: {themes}
+
+MAIN CONTRIBUTIONS: {contributions}
+
+RESEARCH GAPS: {gaps}
+
+METHODOLOGIES REVIEWED: {methodologies}
+
+STRUCTURE (2-3 paragraphs, 200-350 words total):
+
+PARAGRAPH 1 - SYNTHESIS OF KEY FINDINGS:
+- Summarize the 3-4 most significant findings from the reviewed literature
+- State what the collective evidence demonstrates
+- Acknowledge limitations of current evidence
+
+PARAGRAPH 2 - LIMITATIONS AND GAPS:
+- Identify methodological limitations across the reviewed studies with citations
+- Note gaps in the current body of knowledge
+- Connect gaps to specific missing studies or methodologies
+- Be specific about what remains unknown or understudied
+
+PARAGRAPH 3 (OPTIONAL) - FUTURE RESEARCH DIRECTIONS:
+- Suggest concrete directions for future investigation
+- Base suggestions on limitations found in reviewed papers
+- Be specific and actionable
+
+CRITICAL REQUIREMENTS:
+- Keep within 200-350 words
+- Be concise and substantive
+- End with a clear forward-looking statement grounded in literature""")
+])
+
+CITATION_REPAIR_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an academic editor correcting in-text citations in a literature review.
+Change only the citations in each sentence; keep every other word unchanged.
+Citation format MUST be (Author et al., Year) with exact author names and years from the provided references.
+If a claim cannot be attributed to any listed paper, remove its citation and hedge the claim instead of inventing one.
+Respond with a JSON object."""),
+    ("user", """These in-text citations do not match the paper references:
+{bad_citations}
+
+PAPER REFERENCES (the only valid sources):
+{paper_references}
+
+SENTENCES TO CORRECT (JSON array):
+{sentences}
+
+Return a JSON object mapping each original sentence, copied exactly, to its corrected version.""")
+])
+
+# Appended to a section prompt when the previous draft failed validation, so a
+# regeneration is told what to fix instead of resampling the same request
+REVISION_INSTRUCTIONS = """Your previous draft of this section failed automated review. Write a new version that fixes these problems:
+{revision_feedback}
+
+Keep the required structure, length and (Author et al., Year) citation format."""
+
+INTRODUCTION_REGENERATION_PROMPT = ChatPromptTemplate.from_messages(
+    INTRODUCTION_PROMPT.messages + [("user", REVISION_INSTRUCTIONS)]
+)
+BODY_REGENERATION_PROMPT = ChatPromptTemplate.from_messages(
+    BODY_PROMPT.messages + [("user", REVISION_INSTRUCTIONS)]
+)
+CONCLUSION_REGENERATION_PROMPT = ChatPromptTemplate.from_messages(
+    CONCLUSION_PROMPT.messages + [("user", REVISION_INSTRUCTIONS)]
+)
+# Failures listed per revision feedback category (keeps regeneration prompts bounded)
+MAX_REVISION_ITEMS = 10
 
 
 class SummarizerAgent(BaseAgent):
@@ -36,30 +349,32 @@ class SummarizerAgent(BaseAgent):
     Agent that synthesizes all research analyses into a cohesive essay
     """
 
+    # Syntheses keyed by a content hash of the rendered prompt (shared across runs)
+    SYNTHESIS_CACHE_TIMEOUT_HOURS = 24
+    _synthesis_cache = LLMCache(ttl_hours=SYNTHESIS_CACHE_TIMEOUT_HOURS)
+    # Sections of essays that passed validation, keyed by their first-pass prompt
+    # (regeneration always samples fresh)
+    _section_cache = LLMCache(ttl_hours=SYNTHESIS_CACHE_TIMEOUT_HOURS)
+
     def __init__(self):
         super().__init__(
             agent_id="summarizer-001",
             name="Summarizer"
         )
-        self.llm = ChatOpenAI(
-            model=GPT_MODEL,
-            api_key=OPENAI_API_KEY,
-            temperature=0.3  # Precise academic tone
+        self.llm = get_llm(SUMMARIZER_TEMPERATURE).bind(max_tokens=SECTION_MAX_OUTPUT_TOKENS)
+        # Synthesis and citation repair use JSON mode so responses always parse as JSON objects
+        self._synthesis_llm = self.llm.bind(
+            response_format={"type": "json_object"}, max_tokens=SYNTHESIS_MAX_OUTPUT_TOKENS
         )
+        self._citation_repair_chain = CITATION_REPAIR_PROMPT | self._synthesis_llm
         self.quality_scorer = QualityScoringService()
         self.citation_verifier = CitationVerificationService()
         self.fact_checker = FactCheckingService()
         self.regeneration_attempts = 0
+        self.section_cache_keys = {}  # Section name -> first-pass prompt key for this run
         self.reasoning_trace = {}  # Track ReAct reasoning output
         self.execution_start_time = None  # Track execution time for timeout checks
 
-        # Configure stdout for UTF-8 encoding on Windows
-        if sys.stdout.encoding != 'utf-8':
-            try:
-                sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-            except Exception as e:
-                pass  # Fallback to default encoding if reconfiguration fails
-
     def _safe_print(self, message: str):
         """Safely print message with Unicode encoding error handling"""
         try:
@@ -81,12 +396,10 @@ class SummarizerAgent(BaseAgent):
         Returns:
             Essay text and metadata
         """
-        # Initialize execution timer
-        if self.execution_start_time is None:
-            self.execution_start_time = time.time()
-
-        # Initialize quality warnings list (used by graceful degradation in validation layers)
-        quality_warnings = []
+        # Initialize execution timer and regeneration budget for this run
+        self.execution_start_time = time.time()
+        self.regeneration_attempts = 0
+        self.section_cache_keys = {}
 
         query = task.get("query", "")
         analyses = task.get("analyses", [])
@@ -117,8 +430,9 @@ A comprehensive review of academic sources would strengthen understanding of thi
 peer-reviewed papers and empirical data.*"""
 
             # Still process evaluation even without analyses (for feedback purposes)
-            file_path = self._save_essay(query, fallback_essay)
-            metadata = self._generate_metadata(fallback_essay, [])
+            generated_at = datetime.now()
+            file_path = await self._save_essay(query, fallback_essay, generated_at.strftime("%Y%m%d_%H%M%S"))
+            metadata = self._generate_metadata(fallback_essay, [], generated_at)
 
             return {
                 "status": "completed",
@@ -144,117 +458,162 @@ peer-reviewed papers and empirical data.*"""
         # Step 2: Build paper reference data for citation injection
         paper_references = self._build_paper_reference_data(analyses)
 
-        # Step 3: Generate essay sections
-        introduction = await self._generate_introduction(query, analyses, synthesis, paper_references)
-        body = await self._generate_body(synthesis, analyses, paper_references)
-        conclusion = await self._generate_conclusion(query, synthesis, paper_references)
-
-        # Step 4: Compile complete essay (both visual and audio versions)
-        essay, audio_essay = self._compile_essay(
-            query=query,
-            introduction=introduction,
-            body=body,
-            conclusion=conclusion,
-            analyses=analyses
+        # Step 3: Generate essay sections concurrently (each only needs the synthesis,
+        # and each returns a placeholder string instead of raising on failure)
+        sections = await self._generate_sections(
+            ESSAY_SECTIONS, query, analyses, synthesis, paper_references
         )
 
-        # LAYER 3: Quality Scoring Assessment
-        self._safe_print(f"\n[Summarizer] Assessing essay quality...")
-        try:
-            quality_result = await self.quality_scorer.score_essay(essay, analyses)
-            quality_score = quality_result["overall_score"]
-        except UnicodeEncodeError as e:
-            import logging
-            logger = logging.getLogger('aura.summarizer')
-            logger.error(f"Unicode encoding error during quality assessment: {e}")
-            # Fallback: assign a moderate quality score
-            quality_result = {
-                "overall_score": 6.5,
-                "scores": {},
-                "citation_count": 0,
-                "word_count": len(essay.split()),
-                "assessment": "adequate",
-                "issues": ["Unicode encoding issue during assessment"]
-            }
-            quality_score = 6.5
-
-        if quality_score < MIN_QUALITY_SCORE:
-            elapsed = time.time() - self.execution_start_time
-
-            # Try regeneration if attempts remain and time allows
-            if self.regeneration_attempts < MAX_ESSAY_REGENERATION_ATTEMPTS and elapsed < GRACEFUL_DEGRADATION_THRESHOLD:
-                self.regeneration_attempts += 1
-                self._safe_print(f"[Summarizer] ⚠️  Quality score {quality_score:.1f} below threshold. Regenerating... (attempt {self.regeneration_attempts}/{MAX_ESSAY_REGENERATION_ATTEMPTS}, elapsed: {elapsed:.0f}s)")
-                # Recursively regenerate with stricter requirements
-                return await self.run(task)
-
-            # Graceful degradation: Time budget exceeded - accept with warning instead of failing
-            elif elapsed >= GRACEFUL_DEGRADATION_THRESHOLD:
-                self._safe_print(f"[Summarizer] ⚠️  GRACEFUL DEGRADATION: Accepting essay with quality score {quality_score:.1f} (below threshold, time budget exceeded)")
-                quality_warnings.append(f"Quality score {quality_score:.1f} below threshold {MIN_QUALITY_SCORE} (time limit reached)")
-
-            # Regeneration exhaustion fallback - accept with warning instead of failing
-            elif self.regeneration_attempts >= MAX_ESSAY_REGENERATION_ATTEMPTS:
-                self._safe_print(f"[Summarizer] ⚠️  REGENERATION EXHAUSTED: Accepting essay with quality score {quality_score:.1f} (exceeded max attempts)")
-                quality_warnings.append(f"Quality score {quality_score:.1f} below threshold {MIN_QUALITY_SCORE} (regeneration limit reached)")
-
-        self._safe_print(f"[Summarizer] ✓ Quality score: {quality_score:.1f}/10.0")
-
-        # LAYER 4: Citation Verification
-        self._safe_print(f"[Summarizer] Verifying citations...")
-        citation_result = await self.citation_verifier.verify_citations(essay)
-
-        if not citation_result.is_valid:
-            elapsed = time.time() - self.execution_start_time
-
-            # Try regeneration if attempts remain and time allows
-            if self.regeneration_attempts < MAX_ESSAY_REGENERATION_ATTEMPTS and elapsed < GRACEFUL_DEGRADATION_THRESHOLD:
-                self.regeneration_attempts += 1
-                self._safe_print(f"[Summarizer] ⚠️  Citation verification failed ({citation_result.success_rate*100:.1f}% accuracy). Regenerating... (attempt {self.regeneration_attempts}/{MAX_ESSAY_REGENERATION_ATTEMPTS}, elapsed: {elapsed:.0f}s)")
-                return await self.run(task)
-
-            # Graceful degradation: Time budget exceeded - accept with warning instead of failing
-            elif elapsed >= GRACEFUL_DEGRADATION_THRESHOLD:
-                self._safe_print(f"[Summarizer] ⚠️  GRACEFUL DEGRADATION: Accepting essay with citation accuracy {citation_result.success_rate*100:.1f}% (below threshold, time budget exceeded)")
-                quality_warnings.append(f"Citation accuracy {citation_result.success_rate*100:.1f}% below threshold {MIN_CITATION_ACCURACY*100:.0f}% (time limit reached)")
-
-            # Regeneration exhaustion fallback - accept with warning instead of failing
-            elif self.regeneration_attempts >= MAX_ESSAY_REGENERATION_ATTEMPTS:
-                self._safe_print(f"[Summarizer] ⚠️  REGENERATION EXHAUSTED: Accepting essay with citation accuracy {citation_result.success_rate*100:.1f}% (exceeded max attempts)")
-                quality_warnings.append(f"Citation accuracy {citation_result.success_rate*100:.1f}% below threshold {MIN_CITATION_ACCURACY*100:.0f}% (regeneration limit reached)")
-
-        self._safe_print(f"[Summarizer] ✓ Citation verification passed ({citation_result.success_rate*100:.1f}% accuracy)")
-
-        # LAYER 5: Fact-Checking
-        self._safe_print(f"[Summarizer] Running fact-checking verification...")
-        fact_check_result = await self.fact_checker.verify_essay_claims(essay, analyses)
-
-        if not fact_check_result["is_valid"]:
-            elapsed = time.time() - self.execution_start_time
-
-            # Try regeneration if attempts remain and time allows
-            if self.regeneration_attempts < MAX_ESSAY_REGENERATION_ATTEMPTS and elapsed < GRACEFUL_DEGRADATION_THRESHOLD:
-                self.regeneration_attempts += 1
-                self._safe_print(f"[Summarizer] ⚠️  Fact-checking failed ({fact_check_result['supported_percentage']*100:.1f}% claims verified). Regenerating... (attempt {self.regeneration_attempts}/{MAX_ESSAY_REGENERATION_ATTEMPTS}, elapsed: {elapsed:.0f}s)")
-                return await self.run(task)
-
-            # Graceful degradation: Time budget exceeded - accept with warning instead of failing
-            elif elapsed >= GRACEFUL_DEGRADATION_THRESHOLD:
-                self._safe_print(f"[Summarizer] ⚠️  GRACEFUL DEGRADATION: Accepting essay with {fact_check_result['supported_percentage']*100:.1f}% verified claims (below threshold, time budget exceeded)")
-                quality_warnings.append(f"Fact-check: {fact_check_result['supported_percentage']*100:.1f}% verified claims below threshold {MIN_SUPPORTED_CLAIMS_PCT*100:.0f}% (time limit reached)")
-
-            # Regeneration exhaustion fallback - accept with warning instead of failing
-            elif self.regeneration_attempts >= MAX_ESSAY_REGENERATION_ATTEMPTS:
-                self._safe_print(f"[Summarizer] ⚠️  REGENERATION EXHAUSTED: Accepting essay with {fact_check_result['supported_percentage']*100:.1f}% verified claims (exceeded max attempts)")
-                quality_warnings.append(f"Fact-check: {fact_check_result['supported_percentage']*100:.1f}% verified claims below threshold {MIN_SUPPORTED_CLAIMS_PCT*100:.0f}% (regeneration limit reached)")
-
-        self._safe_print(f"[Summarizer] ✓ Fact-checking passed ({fact_check_result['supported_percentage']*100:.1f}% of claims verified)")
+        # Steps 4-5 repeat until the essay passes validation or regeneration stops.
+        # Synthesis and references are reused; a failed layer only regenerates the
+        # sections it depends on.
+        citation_repair_attempted = False
+        # One timestamp for the essay date, file names / session ID and metadata
+        generated_at = datetime.now()
+        while True:
+            # Quality warnings describe the accepted essay only
+            quality_warnings = []
+
+            # Step 4: Compile complete essay (both visual and audio versions)
+            essay, audio_essay = self._compile_essay(
+                query=query,
+                introduction=sections["introduction"],
+                body=sections["body"],
+                conclusion=sections["conclusion"],
+                analyses=analyses,
+                generated_at=generated_at
+            )
 
-        # Step 5: Save essay to file
-        file_path = self._save_essay(query, essay)
+            # LAYER 3: Quality Scoring Assessment
+            self._safe_print(f"\n[Summarizer] Assessing essay quality...")
+            try:
+                quality_result = await self.quality_scorer.score_essay(essay, analyses)
+                quality_score = quality_result["overall_score"]
+            except UnicodeEncodeError as e:
+                logger.error(f"Unicode encoding error during quality assessment: {e}")
+                # Fallback: assign a moderate quality score
+                quality_result = {
+                    "overall_score": 6.5,
+                    "scores": {},
+                    "citation_count": 0,
+                    "word_count": len(essay.split()),
+                    "assessment": "adequate",
+                    "issues": ["Unicode encoding issue during assessment"]
+                }
+                quality_score = 6.5
+
+            if quality_score < MIN_QUALITY_SCORE:
+                elapsed = time.time() - self.execution_start_time
+
+                # Try regeneration if attempts remain and time allows
+                if self.regeneration_attempts < MAX_ESSAY_REGENERATION_ATTEMPTS and elapsed < GRACEFUL_DEGRADATION_THRESHOLD:
+                    self.regeneration_attempts += 1
+                    self._safe_print(f"[Summarizer] ⚠️  Quality score {quality_score:.1f} below threshold. Regenerating... (attempt {self.regeneration_attempts}/{MAX_ESSAY_REGENERATION_ATTEMPTS}, elapsed: {elapsed:.0f}s)")
+                    # Quality issues live in the argument: rewrite body and conclusion
+                    sections = await self._generate_sections(
+                        ("body", "conclusion"), query, analyses, synthesis, paper_references, sections,
+                        revision_feedback=self._quality_feedback(quality_result)
+                    )
+                    continue
+
+                # Graceful degradation: Time budget exceeded - accept with warning instead of failing
+                elif elapsed >= GRACEFUL_DEGRADATION_THRESHOLD:
+                    self._safe_print(f"[Summarizer] ⚠️  GRACEFUL DEGRADATION: Accepting essay with quality score {quality_score:.1f} (below threshold, time budget exceeded)")
+                    quality_warnings.append(f"Quality score {quality_score:.1f} below threshold {MIN_QUALITY_SCORE} (time limit reached)")
+
+                # Regeneration exhaustion fallback - accept with warning instead of failing
+                elif self.regeneration_attempts >= MAX_ESSAY_REGENERATION_ATTEMPTS:
+                    self._safe_print(f"[Summarizer] ⚠️  REGENERATION EXHAUSTED: Accepting essay with quality score {quality_score:.1f} (exceeded max attempts)")
+                    quality_warnings.append(f"Quality score {quality_score:.1f} below threshold {MIN_QUALITY_SCORE} (regeneration limit reached)")
+
+            self._safe_print(f"[Summarizer] ✓ Quality score: {quality_score:.1f}/10.0")
+
+            # LAYER 4: Citation Verification
+            self._safe_print(f"[Summarizer] Verifying citations...")
+            citation_result = await self.citation_verifier.verify_citations(essay)
+
+            if not citation_result.is_valid:
+                elapsed = time.time() - self.execution_start_time
+
+                # Try regeneration if attempts remain and time allows
+                if self.regeneration_attempts < MAX_ESSAY_REGENERATION_ATTEMPTS and elapsed < GRACEFUL_DEGRADATION_THRESHOLD:
+                    self.regeneration_attempts += 1
+                    self._safe_print(f"[Summarizer] ⚠️  Citation verification failed ({citation_result.success_rate*100:.1f}% accuracy). Regenerating... (attempt {self.regeneration_attempts}/{MAX_ESSAY_REGENERATION_ATTEMPTS}, elapsed: {elapsed:.0f}s)")
+                    # First splice corrected sentences in; rewrite every section (they all
+                    # cite papers) if a repair was already tried or could not be applied
+                    repaired = None
+                    if not citation_repair_attempted:
+                        citation_repair_attempted = True
+                        repaired = await self._repair_citations(sections, citation_result, paper_references)
+                    if repaired is not None:
+                        sections = repaired
+                    else:
+                        sections = await self._generate_sections(
+                            ESSAY_SECTIONS, query, analyses, synthesis, paper_references, sections,
+                            revision_feedback=self._citation_feedback(citation_result, paper_references)
+                        )
+                    continue
+
+                # Graceful degradation: Time budget exceeded - accept with warning instead of failing
+                elif elapsed >= GRACEFUL_DEGRADATION_THRESHOLD:
+                    self._safe_print(f"[Summarizer] ⚠️  GRACEFUL DEGRADATION: Accepting essay with citation accuracy {citation_result.success_rate*100:.1f}% (below threshold, time budget exceeded)")
+                    quality_warnings.append(f"Citation accuracy {citation_result.success_rate*100:.1f}% below threshold {MIN_CITATION_ACCURACY*100:.0f}% (time limit reached)")
+
+                # Regeneration exhaustion fallback - accept with warning instead of failing
+                elif self.regeneration_attempts >= MAX_ESSAY_REGENERATION_ATTEMPTS:
+                    self._safe_print(f"[Summarizer] ⚠️  REGENERATION EXHAUSTED: Accepting essay with citation accuracy {citation_result.success_rate*100:.1f}% (exceeded max attempts)")
+                    quality_warnings.append(f"Citation accuracy {citation_result.success_rate*100:.1f}% below threshold {MIN_CITATION_ACCURACY*100:.0f}% (regeneration limit reached)")
+
+            self._safe_print(f"[Summarizer] ✓ Citation verification passed ({citation_result.success_rate*100:.1f}% accuracy)")
+
+            # LAYER 5: Fact-Checking
+            self._safe_print(f"[Summarizer] Running fact-checking verification...")
+            fact_check_result = await self.fact_checker.verify_essay_claims(essay, analyses)
+
+            if not fact_check_result["is_valid"]:
+                elapsed = time.time() - self.execution_start_time
+
+                # Try regeneration if attempts remain and time allows
+                if self.regeneration_attempts < MAX_ESSAY_REGENERATION_ATTEMPTS and elapsed < GRACEFUL_DEGRADATION_THRESHOLD:
+                    self.regeneration_attempts += 1
+                    self._safe_print(f"[Summarizer] ⚠️  Fact-checking failed ({fact_check_result['supported_percentage']*100:.1f}% claims verified). Regenerating... (attempt {self.regeneration_attempts}/{MAX_ESSAY_REGENERATION_ATTEMPTS}, elapsed: {elapsed:.0f}s)")
+                    # Checked claims come from the body and conclusion: rewrite those
+                    sections = await self._generate_sections(
+                        ("body", "conclusion"), query, analyses, synthesis, paper_references, sections,
+                        revision_feedback=self._fact_check_feedback(fact_check_result)
+                    )
+                    continue
+
+                # Graceful degradation: Time budget exceeded - accept with warning instead of failing
+                elif elapsed >= GRACEFUL_DEGRADATION_THRESHOLD:
+                    self._safe_print(f"[Summarizer] ⚠️  GRACEFUL DEGRADATION: Accepting essay with {fact_check_result['supported_percentage']*100:.1f}% verified claims (below threshold, time budget exceeded)")
+                    quality_warnings.append(f"Fact-check: {fact_check_result['supported_percentage']*100:.1f}% verified claims below threshold {MIN_SUPPORTED_CLAIMS_PCT*100:.0f}% (time limit reached)")
+
+                # Regeneration exhaustion fallback - accept with warning instead of failing
+                elif self.regeneration_attempts >= MAX_ESSAY_REGENERATION_ATTEMPTS:
+                    self._safe_print(f"[Summarizer] ⚠️  REGENERATION EXHAUSTED: Accepting essay with {fact_check_result['supported_percentage']*100:.1f}% verified claims (exceeded max attempts)")
+                    quality_warnings.append(f"Fact-check: {fact_check_result['supported_percentage']*100:.1f}% verified claims below threshold {MIN_SUPPORTED_CLAIMS_PCT*100:.0f}% (regeneration limit reached)")
+
+            self._safe_print(f"[Summarizer] ✓ Fact-checking passed ({fact_check_result['supported_percentage']*100:.1f}% of claims verified)")
+
+            break
+
+        # Only an essay that passed every layer may be replayed: its final sections
+        # answer the first-pass prompts of a matching re-run
+        if not quality_warnings:
+            for name, key in self.section_cache_keys.items():
+                self._section_cache.set(key, sections[name])
+
+        # Step 5: Save essay to file while the RAG vector store is built (neither needs
+        # the other; both use the same session timestamp)
+        session_id = generated_at.strftime("%Y%m%d_%H%M%S")
+        file_path, rag_initialized = await asyncio.gather(
+            self._save_essay(query, essay, session_id),
+            asyncio.to_thread(self._initialize_rag_vector_store, session_id, analyses, essay, query)
+        )
 
         # Step 6: Generate metadata
-        metadata = self._generate_metadata(essay, analyses)
+        metadata = self._generate_metadata(essay, analyses, generated_at)
 
         self._safe_print(f"[Summarizer] Essay generated: {metadata['word_count']} words, {metadata['citations']} citations")
 
@@ -267,12 +626,8 @@ peer-reviewed papers and empirical data.*"""
         )
         self._safe_print(success_msg)
 
-        # Initialize RAG vector store immediately
-        session_id = self._extract_session_id(file_path)
-        rag_initialized = self._initialize_rag_vector_store(session_id, analyses, essay, query)
-
         # Notify that RAG can be initialized
-        self._notify_rag_ready(file_path, analyses)
+        await self._notify_rag_ready(file_path, analyses)
 
         # Phase 3: Append additional quality warning flags if scores are just below threshold
         # (graceful degradation warnings were already added during validation layers)
@@ -306,14 +661,6 @@ peer-reviewed papers and empirical data.*"""
             **metadata
         }
 
-    def _extract_session_id(self, file_path: str) -> str:
-        """Extract session ID from file path"""
-        import re
-        match = re.search(r'_(\d{8}_\d{6})\.', file_path)
-        if match:
-            return match.group(1)
-        return datetime.now().strftime("%Y%m%d_%H%M%S")
-
     def _initialize_rag_vector_store(
         self,
         session_id: str,
@@ -334,6 +681,7 @@ peer-reviewed papers and empirical data.*"""
             True if successful, False otherwise
         """
         try:
+            # Deferred: the vector store pulls in FAISS and the embeddings client
             from ..rag.vector_store import VectorStoreManager
 
             self._safe_print(f"\n[Summarizer] Initializing RAG vector store for session: {session_id}")
@@ -353,11 +701,10 @@ peer-reviewed papers and empirical data.*"""
 
         except Exception as e:
             self._safe_print(f"[Summarizer] ❌ RAG vector store initialization error: {str(e)}")
-            import traceback
             traceback.print_exc()
             return False
 
-    def _notify_rag_ready(self, essay_file_path: str, analyses: List[Dict[str, Any]]):
+    async def _notify_rag_ready(self, essay_file_path: str, analyses: List[Dict[str, Any]]):
         """
         Notify backend that RAG chatbot can be initialized
 
@@ -373,15 +720,14 @@ peer-reviewed papers and empirical data.*"""
         self._safe_print(f"RAG chatbot can now be activated with this content")
         self._safe_print(f"{'='*60}\n")
 
-        # Create RAG-ready signal file
+        # Create RAG-ready signal file (off the event loop, like the essay files)
         rag_signal_path = Path(ESSAYS_DIR) / "rag_ready.signal"
-        with open(rag_signal_path, 'w', encoding='utf-8') as f:
-            f.write(json.dumps({
-                "essay_path": essay_file_path,
-                "analyses_count": len(analyses),
-                "timestamp": datetime.now().isoformat(),
-                "status": "ready"
-            }, indent=2))
+        await asyncio.to_thread(rag_signal_path.write_bytes, dumps_bytes({
+            "essay_path": essay_file_path,
+            "analyses_count": len(analyses),
+            "timestamp": datetime.now().isoformat(),
+            "status": "ready"
+        }, indent=True))
 
         self._safe_print(f"[Summarizer] RAG signal file created: {rag_signal_path}")
 
@@ -395,43 +741,76 @@ peer-reviewed papers and empirical data.*"""
         """
         references = []
         for i, analysis in enumerate(analyses[:12], 1):  # Cap at 12 papers
-            citations = analysis.get("citations", [])
+            citation = (analysis.get("citations") or [{}])[0]
             metadata = analysis.get("metadata", {})
 
-            title = "Unknown Title"
-            authors = "Unknown"
-            year = "n.d."
-
-            if citations and len(citations) > 0:
-                citation = citations[0]
-                title = citation.get("title", "Unknown Title")
-                raw_authors = citation.get("authors", "Unknown")
-                raw_year = citation.get("year", "n.d.")
-                if raw_authors and raw_authors != "Information not provided in abstract":
-                    authors = raw_authors
-                if raw_year and raw_year != "Information not provided in abstract":
-                    year = raw_year
+            title = citation.get("title", "Unknown Title")
+            raw_authors = citation.get("authors", "Unknown")
+            raw_year = citation.get("year", "n.d.")
+            authors = raw_authors if raw_authors and raw_authors != _NOT_PROVIDED else "Unknown"
+            year = raw_year if raw_year and raw_year != _NOT_PROVIDED else "n.d."
 
             methodology = metadata.get("methodology", analysis.get("summary", "")[:80])
             key_findings = metadata.get("key_findings", "")
             novelty = metadata.get("novelty", "")
-
             if isinstance(key_findings, list):
                 key_findings = "; ".join(key_findings[:2])
             if isinstance(novelty, list):
                 novelty = "; ".join(novelty[:2])
 
-            ref = f'[{i}] "{title}" - {authors} ({year})'
+            lines = [f'[{i}] "{title}" - {authors} ({year})']
             if methodology:
-                ref += f'\n    Method: {str(methodology)[:120]}'
+                lines.append(f'    Method: {str(methodology)[:120]}')
             if key_findings:
-                ref += f'\n    Key Finding: {str(key_findings)[:150]}'
+                lines.append(f'    Key Finding: {str(key_findings)[:150]}')
             if novelty:
-                ref += f'\n    Novelty: {str(novelty)[:120]}'
-            references.append(ref)
+                lines.append(f'    Novelty: {str(novelty)[:120]}')
+            references.append("\n".join(lines))
 
         return "\n\n".join(references) if references else "No paper references available."
 
+    @staticmethod
+    def _project_for_synthesis(analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reduce an analysis to the fields the synthesis prompt works from
+
+        Args:
+            analysis: Paper analysis from an analyst agent
+
+        Returns:
+            Compact dict with title, summary, key points, methods, findings and novelty
+        """
+        metadata = analysis.get("metadata", {})
+        citations = analysis.get("citations") or [{}]
+        return {
+            "title": citations[0].get("title", ""),
+            "summary": str(analysis.get("summary", ""))[:400],
+            "key_points": analysis.get("key_points", [])[:5],
+            "methodology": str(metadata.get("methodology", ""))[:400],
+            "key_findings": metadata.get("key_findings", [])[:3],
+            "novelty": str(metadata.get("novelty", ""))[:300]
+        }
+
+    def _synthesis_input(self, analyses: List[Dict[str, Any]]) -> str:
+        """
+        Serialize analyses for the synthesis prompt within SYNTHESIS_MAX_INPUT_TOKENS
+
+        Args:
+            analyses: List of paper analyses
+
+        Returns:
+            Compact JSON; when over budget, only the most relevant papers that fit
+        """
+        projected = [self._project_for_synthesis(analysis) for analysis in analyses]
+        kept = fit_to_token_budget(
+            projected,
+            SYNTHESIS_MAX_INPUT_TOKENS,
+            [analysis.get("metadata", {}).get("relevance_score") for analysis in analyses]
+        )
+        if len(kept) < len(projected):
+            self._safe_print(f"[Summarizer] Synthesis input trimmed to {len(kept)}/{len(analyses)} most relevant papers")
+        return dumps(kept)
+
     async def _create_synthesis(
         self,
         query: str,
@@ -447,115 +826,25 @@ peer-reviewed papers and empirical data.*"""
         Returns:
             Structured synthesis with themes and patterns
         """
-        synthesis_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a WORLD-CLASS research synthesizer with expertise in meta-analysis and systematic reviews.
-
-APPLY ReAct FRAMEWORK (Reasoning + Acting):
-
-STEP 1 - THOUGHT: What patterns emerge across all papers? What are the recurring themes?
-STEP 2 - ACTION: Extract specific themes, methodologies, findings from each paper systematically
-STEP 3 - OBSERVATION: Note agreements, conflicts, and progressions in the field
-STEP 4 - REFLECTION: What does the collective evidence suggest? What remains unknown?
-
-CRITICAL REQUIREMENTS:
-1. Extract SPECIFIC themes using actual terminology from the papers
-2. Identify CONCRETE methodologies with precise names (algorithms, frameworks, techniques)
-3. Synthesize SUBSTANTIVE findings (not generic statements)
-4. Be scholarly, precise, and insightful
-5. Think like a senior researcher conducting a literature review
-
-Your synthesis will guide the final essay - make it exceptional."""),
-            ("user", """CONDUCT A COMPREHENSIVE SYNTHESIS OF RESEARCH FINDINGS
-
-Research Query: {query}
-Number of Papers: {count}
-
-═══════════════════════════════════════════════════════════
-PAPER ANALYSES:
-{analyses}
-═══════════════════════════════════════════════════════════
-
-APPLY REACT REASONING:
-
-THOUGHT: Examine all papers. What patterns appear? What methodologies recur? What findings repeat?
-
-ACTION: For each paper, extract:
-  - Main themes and terminology used
-  - Specific methods, algorithms, frameworks employed
-  - Key results and metrics
-  - Limitations noted
-  - Future work suggested
-
-OBSERVATION: Compare across papers:
-  - Which findings are consistent across studies?
-  - Where do papers conflict or diverge?
-  - What methodological approaches dominate?
-  - What are common research gaps?
-
-SYNTHESIS REQUIREMENTS:
-
-1. MAIN THEMES (5-8 themes):
-   - Identify SPECIFIC recurring topics using exact terminology from papers
-   - Example: "Transformer-based architectures for sequence modeling" NOT "deep learning methods"
-   - Each theme should be substantive and precise
-
-2. METHODOLOGIES (5-10 specific methods):
-   - List EXACT methods, algorithms, frameworks mentioned
-   - Examples: "BERT fine-tuning", "Proximal Policy Optimization", "Variational Autoencoders"
-   - NOT generic like "machine learning approaches"
-
-3. KEY FINDINGS (8-12 findings):
-   - Extract SPECIFIC discoveries, improvements, or insights
-   - Include metrics if mentioned (e.g., "achieved 95% accuracy on ImageNet")
-   - Each finding should be concrete and informative
-
-4. CONTRADICTIONS (if any):
-   - Identify where papers disagree or present conflicting results
-   - Be specific about what conflicts and why
-
-5. RESEARCH GAPS (3-7 gaps):
-   - What questions remain unanswered?
-   - What limitations were noted?
-   - What future work was suggested?
-
-6. TOP CONTRIBUTIONS (5-8 contributions):
-   - What are the most significant advances from these papers?
-   - What novel techniques or insights were introduced?
-   - What practical applications were demonstrated?
-
-OUTPUT IN PRECISE JSON FORMAT:
-{{
-    "main_themes": ["Specific theme 1 with technical detail", "Specific theme 2...", ...],
-    "methodologies": ["Exact method 1", "Exact algorithm 2", "Specific framework 3", ...],
-    "key_findings": ["Concrete finding 1 with details", "Specific result 2", ...],
-    "contradictions": ["Specific contradiction 1 if found", ...],
-    "research_gaps": ["Specific gap 1", "Unanswered question 2", ...],
-    "top_contributions": ["Major contribution 1 with specifics", "Novel technique 2", ...]
-}}
-
-CRITICAL: Every item must be SPECIFIC and SUBSTANTIVE. No generic placeholders.""")
-        ])
-
         try:
-            chain = synthesis_prompt | self.llm
-            response = await asyncio.wait_for(
-                chain.ainvoke({
-                    "query": query,
-                    "count": len(analyses),
-                    "analyses": json.dumps(analyses[:20], indent=2)  # Limit to prevent token overflow
-                }),
-                timeout=LLM_CALL_TIMEOUT
+            messages = SYNTHESIS_PROMPT.format_messages(
+                query=query,
+                count=len(analyses),
+                analyses=self._synthesis_input(analyses)
             )
-
-            content = response.content
-
-            # Extract JSON from markdown if needed
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            synthesis_result = json.loads(content)
+            # Same query over the same analyses (e.g. cached paper analyses on a re-run)
+            # renders the same prompt, so the synthesis can be reused
+            key = cache_key(GPT_MODEL, SUMMARIZER_TEMPERATURE, messages)
+            synthesis_result = self._synthesis_cache.get(key)
+            if synthesis_result is None:
+                response = await asyncio.wait_for(
+                    self._synthesis_llm.ainvoke(messages),
+                    timeout=LLM_CALL_TIMEOUT
+                )
+                synthesis_result = loads(response.content)
+                self._synthesis_cache.set(key, synthesis_result)
+            else:
+                self._safe_print(f"[Summarizer] Reusing cached synthesis")
 
             # Store reasoning trace for metadata
             self.reasoning_trace["synthesis"] = {
@@ -567,280 +856,219 @@ CRITICAL: Every item must be SPECIFIC and SUBSTANTIVE. No generic placeholders."
                 "gaps_identified": len(synthesis_result.get("research_gaps", []))
             }
 
-            return synthesis_result
-
-        except Exception as e:
-            print(f"[Summarizer] Synthesis error: {str(e)}")
-            self.reasoning_trace["synthesis"] = {"error": str(e)}
-            return {
-                "main_themes": ["Analysis in progress"],
-                "methodologies": [],
-                "key_findings": [],
-                "contradictions": [],
-                "research_gaps": [],
-                "top_contributions": []
-            }
-
-    async def _generate_introduction(
-        self,
-        query: str,
-        analyses: List[Dict[str, Any]],
-        synthesis: Dict[str, Any],
-        paper_references: str
-    ) -> str:
-        """Generate essay introduction in academic literature review style with ReAct reasoning"""
-        intro_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a senior research scientist writing a literature review for a peer-reviewed journal.
-Your prose is clear, precise, and evidence-based. Use formal academic English, passive voice
-where appropriate, hedged claims, and specific citations in (Author et al., Year) format.
-Do not use flowery or philosophical language. Be direct, scholarly, and rigorous.
-
-APPLY REACT THINKING:
-THOUGHT: What is the research context? What papers establish foundational knowledge?
-ACTION: Select 2-3 key papers that introduce the domain. Extract their core contributions.
-OBSERVATION: What is the state of knowledge that these papers establish?
-REFLECTION: What narrative connects these papers to justify this literature review?
-
-CRITICAL ACADEMIC INTEGRITY REQUIREMENTS:
-1. EVERY factual claim MUST be supported by specific citations
-2. Use ONLY information available in the provided paper references
-3. If you cannot find supporting evidence, DO NOT include it
-4. Use hedging language: "suggests", "may indicate", "appears to"
-5. Never extrapolate beyond what papers explicitly state
-6. Citation format MUST be (Author et al., Year) with exact author names
-7. Do not invent or approximate citations
-8. If references are insufficient, state this clearly rather than generating unsupported content"""),
-            ("user", """Write the INTRODUCTION for a literature review on the following topic.
-
-TOPIC: {query}
-NUMBER OF PAPERS REVIEWED: {count}
+            return synthesis_result
 
-PAPER REFERENCES (use ONLY these for citations - do not cite papers not in this list):
-{paper_references}
+        except Exception as e:
+            print(f"[Summarizer] Synthesis error: {str(e)}")
+            self.reasoning_trace["synthesis"] = {"error": str(e)}
+            return {
+                "main_themes": ["Analysis in progress"],
+                "methodologies": [],
+                "key_findings": [],
+                "contradictions": [],
+                "research_gaps": [],
+                "top_contributions": []
+            }
 
-THEMES IDENTIFIED:
-{themes}
+    async def _generate_sections(
+        self,
+        names: Tuple[str, ...],
+        query: str,
+        analyses: List[Dict[str, Any]],
+        synthesis: Dict[str, Any],
+        paper_references: str,
+        sections: Optional[Dict[str, str]] = None,
+        revision_feedback: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Generate (or regenerate) the named essay sections concurrently
 
-STRUCTURE (2 paragraphs, 150-250 words total):
+        Args:
+            names: Sections to generate, from ESSAY_SECTIONS
+            query: Research query
+            analyses: List of paper analyses
+            synthesis: Structured synthesis
+            paper_references: Formatted reference data for citations
+            sections: Current sections; those not named are kept as they are
+                (passing them marks a regeneration, which bypasses the section cache)
+            revision_feedback: Validation failures the regenerated sections must fix
 
-PARAGRAPH 1 - RESEARCH CONTEXT AND SIGNIFICANCE:
-- Introduce the research domain and its importance
-- Cite 2-3 specific papers from the references using (Author et al., Year) format
-- Establish the current state of knowledge
-- Use hedging language where appropriate
+        Returns:
+            Section name -> text for all sections
+        """
+        use_cache = sections is None
+        generators = {
+            "introduction": lambda: self._generate_introduction(
+                query, analyses, synthesis, paper_references, use_cache, revision_feedback
+            ),
+            "body": lambda: self._generate_body(synthesis, analyses, paper_references, use_cache, revision_feedback),
+            "conclusion": lambda: self._generate_conclusion(
+                query, synthesis, paper_references, use_cache, revision_feedback
+            )
+        }
+        ordered = [name for name in ESSAY_SECTIONS if name in names]
+        results = await asyncio.gather(*(generators[name]() for name in ordered))
+        updated = dict(sections or {})
+        updated.update(zip(ordered, results))
+        return updated
 
-PARAGRAPH 2 - SCOPE OF THIS REVIEW:
-- State the number of papers reviewed
-- Preview the major themes that will be discussed
-- Briefly outline the structure of the review
+    async def _invoke_section(
+        self,
+        section: str,
+        prompt: ChatPromptTemplate,
+        inputs: Dict[str, Any],
+        use_cache: bool,
+        model: str = GPT_MODEL,
+        revision_prompt: Optional[ChatPromptTemplate] = None,
+        revision_feedback: Optional[str] = None
+    ) -> str:
+        """
+        Generate one essay section, reusing an identical earlier request when allowed
 
-CRITICAL REQUIREMENTS:
-- Use formal academic English throughout
-- Include ONLY (Author et al., Year) citations from the provided references
-- Every claim must be traceable to a specific paper
-- Be precise and evidence-based, not philosophical
-- Use hedging language: suggests, may, appears, indicates
-- Keep within 150-250 words
-- NO unsupported assertions""")
-        ])
+        Args:
+            section: Section name, from ESSAY_SECTIONS
+            prompt: Section prompt template
+            inputs: Template variables
+            use_cache: Whether a cached response may be returned (first pass only); the
+                prompt's key is recorded once a response arrives, so run() can cache the
+                section if the essay passes validation
+            model: Chat model to generate with
+            revision_prompt: Regeneration variant of prompt, used when there is feedback
+            revision_feedback: Validation failures from the previous draft
+
+        Returns:
+            Section text
+        """
+        if revision_feedback and revision_prompt is not None:
+            prompt = revision_prompt
+            inputs = {**inputs, "revision_feedback": revision_feedback}
+        messages = prompt.format_messages(**inputs)
+        key = cache_key(model, SUMMARIZER_TEMPERATURE, messages)
+        cacheable = use_cache and is_cacheable(SUMMARIZER_TEMPERATURE)
+        if cacheable:
+            cached = self._section_cache.get(key)
+            if cached is not None:
+                self.section_cache_keys[section] = key
+                return cached
+
+        llm = self.llm if model == GPT_MODEL else get_llm(SUMMARIZER_TEMPERATURE, model).bind(
+            max_tokens=SECTION_MAX_OUTPUT_TOKENS
+        )
+        response = await asyncio.wait_for(llm.ainvoke(messages), timeout=LLM_CALL_TIMEOUT)
+        # Recorded only once a real response arrives, so a fallback placeholder is never cached
+        if cacheable:
+            self.section_cache_keys[section] = key
+        return response.content.strip()
 
+    async def _generate_introduction(
+        self,
+        query: str,
+        analyses: List[Dict[str, Any]],
+        synthesis: Dict[str, Any],
+        paper_references: str,
+        use_cache: bool = True,
+        revision_feedback: Optional[str] = None
+    ) -> str:
+        """Generate essay introduction in academic literature review style with ReAct reasoning"""
         try:
             themes = synthesis.get("main_themes", [])
-            chain = intro_prompt | self.llm
-            response = await asyncio.wait_for(
-                chain.ainvoke({
-                    "query": query,
-                    "count": len(analyses),
-                    "paper_references": paper_references,
-                    "themes": "\n- ".join(themes) if themes else "General research themes"
-                }),
-                timeout=LLM_CALL_TIMEOUT
-            )
-            return response.content.strip()
+            return await self._invoke_section("introduction", INTRODUCTION_PROMPT, {
+                "query": query,
+                "count": len(analyses),
+                "paper_references": paper_references,
+                "themes": "\n- ".join(themes) if themes else "General research themes"
+            }, use_cache, revision_prompt=INTRODUCTION_REGENERATION_PROMPT, revision_feedback=revision_feedback)
         except Exception as e:
+            self.section_cache_keys.pop("introduction", None)  # The placeholder must not be cached
             return f"Introduction could not be generated: {str(e)}"
 
     async def _generate_body(
         self,
         synthesis: Dict[str, Any],
         analyses: List[Dict[str, Any]],
-        paper_references: str
+        paper_references: str,
+        use_cache: bool = True,
+        revision_feedback: Optional[str] = None
     ) -> str:
         """Generate essay body in academic literature review style with thematic organization and ReAct reasoning"""
-        body_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a senior research scientist writing the body of a literature review for a peer-reviewed journal.
-Organize the review thematically. For each theme, cite specific papers using (Author et al., Year) format.
-Compare and contrast findings across studies. Note methodological differences.
-Use formal academic English, passive voice where appropriate, and hedged claims.
-Do not use flowery or philosophical language. Be direct, scholarly, and analytical.
-
-APPLY REACT THINKING:
-THOUGHT: Which papers address each theme? What are the key variations in approach or findings?
-ACTION: For each theme, identify 2-4 papers. Extract their methods and results with citations.
-OBSERVATION: How do the findings align or diverge? What methodological differences explain variations?
-REFLECTION: What synthesis of these papers reveals about the theme's current state of knowledge?
-
-CRITICAL ACADEMIC INTEGRITY REQUIREMENTS:
-1. EVERY claim about research findings MUST cite specific papers
-2. Use ONLY papers from the provided references - do not reference papers not in the list
-3. When comparing studies, cite each study explicitly
-4. When noting differences, show them with explicit citations
-5. Use hedging language: "suggests", "may indicate", "appears", "indicates"
-6. Do not extrapolate beyond what papers state
-7. Citation format MUST be (Author et al., Year) - match reference list exactly
-8. If you cannot support a claim with provided papers, omit it
-9. For methodological analysis, explicitly compare approaches using citations"""),
-            ("user", """Write the BODY of a literature review.
-
-PAPER REFERENCES (use ONLY these for citations - do not cite papers not in this list):
-{paper_references}
-
-THEMES TO COVER:
-{themes}
-
-KEY FINDINGS:
-{findings}
-
-METHODOLOGIES USED:
-{methodologies}
-
-RESEARCH GAPS:
-{gaps}
-
-TOP CONTRIBUTIONS:
-{contributions}
-
-NUMBER OF PAPERS: {count}
-
-STRUCTURE (4-6 paragraphs, 600-900 words total):
-
-Organize by theme. For each major theme:
-- Introduce the theme and its relevance to the research question
-- Cite 2-4 specific papers by (Author et al., Year) from the references above
-- Compare and contrast findings across the cited studies with explicit citations
-- Note methodological differences between approaches with citations
-- Synthesize what the collective evidence suggests (with citations)
-
-CRITICAL REQUIREMENTS:
-- Use formal academic English throughout
-- EVERY claim must reference specific papers with (Author et al., Year) citations
-- Compare and contrast - do not just summarize papers sequentially
-- Note areas of agreement and disagreement with explicit citations
-- Use transitions between themes
-- Use hedging language: suggests, may, appears, indicates
-- All citations must match the provided references exactly
-- Keep within 600-900 words
-- NO unsupported assertions - every claim needs a citation""")
-        ])
-
         try:
-            chain = body_prompt | self.llm
-            response = await asyncio.wait_for(
-                chain.ainvoke({
-                    "themes": "\n- ".join(synthesis.get("main_themes", [])),
-                    "findings": "\n- ".join(synthesis.get("key_findings", [])),
-                    "methodologies": "\n- ".join(synthesis.get("methodologies", [])),
-                    "gaps": "\n- ".join(synthesis.get("research_gaps", [])),
-                    "contributions": "\n- ".join(synthesis.get("top_contributions", [])),
-                    "count": len(analyses),
-                    "paper_references": paper_references
-                }),
-                timeout=LLM_CALL_TIMEOUT
-            )
-            return response.content.strip()
+            return await self._invoke_section("body", BODY_PROMPT, {
+                "themes": "\n- ".join(synthesis.get("main_themes", [])),
+                "findings": "\n- ".join(synthesis.get("key_findings", [])),
+                "methodologies": "\n- ".join(synthesis.get("methodologies", [])),
+                "gaps": "\n- ".join(synthesis.get("research_gaps", [])),
+                "contributions": "\n- ".join(synthesis.get("top_contributions", [])),
+                "count": len(analyses),
+                "paper_references": paper_references
+            }, use_cache, revision_prompt=BODY_REGENERATION_PROMPT, revision_feedback=revision_feedback)
         except Exception as e:
+            self.section_cache_keys.pop("body", None)  # The placeholder must not be cached
             return f"Body section could not be generated: {str(e)}"
 
     async def _generate_conclusion(
         self,
         query: str,
         synthesis: Dict[str, Any],
-        paper_references: str
+        paper_references: str,
+        use_cache: bool = True,
+        revision_feedback: Optional[str] = None
     ) -> str:
         """Generate essay conclusion in academic literature review style with ReAct reasoning"""
-        conclusion_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a senior research scientist writing the conclusion of a literature review for a peer-reviewed journal.
-Synthesize the key findings concisely, identify limitations and gaps, and suggest future research directions.
-Use formal academic English. Be precise, evidence-based, and forward-looking.
-Do not use flowery or philosophical language.
-
-APPLY REACT THINKING:
-THOUGHT: What are the most significant findings across all papers? What remains unresolved?
-ACTION: Identify 3-4 key findings with citations. List specific gaps and limitations found.
-OBSERVATION: Where does the literature have consensus? Where are gaps most critical?
-REFLECTION: What does the evidence collectively suggest? What future research would address key gaps?
-
-CRITICAL ACADEMIC INTEGRITY REQUIREMENTS:
-1. All major findings cited in synthesis MUST reference specific papers
-2. Limitations MUST be tied to specific studies or gaps in the literature
-3. Future research suggestions MUST connect explicitly to identified gaps
-4. Use ONLY papers from the provided references
-5. Use hedging language: "suggests", "may", "appears", "indicates"
-6. Do not make claims unsupported by the reviewed literature
-7. Citation format MUST be (Author et al., Year)
-8. Acknowledge what the current literature can and cannot conclude"""),
-            ("user", """Write the CONCLUSION for a literature review.
-
-TOPIC: {query}
-
-PAPER REFERENCES (use ONLY these for citations):
-{paper_references}
-
-KEY THEMES: {themes}
-
-MAIN CONTRIBUTIONS: {contributions}
-
-RESEARCH GAPS: {gaps}
-
-METHODOLOGIES REVIEWED: {methodologies}
-
-STRUCTURE (2-3 paragraphs, 200-350 words total):
-
-PARAGRAPH 1 - SYNTHESIS OF KEY FINDINGS:
-- Summarize the 3-4 most significant findings from the reviewed literature
-- Reference specific papers where appropriate using (Author et al., Year)
-- State what the collective evidence demonstrates
-- Acknowledge limitations of current evidence
-
-PARAGRAPH 2 - LIMITATIONS AND GAPS:
-- Identify methodological limitations across the reviewed studies with citations
-- Note gaps in the current body of knowledge
-- Connect gaps to specific missing studies or methodologies
-- Be specific about what remains unknown or understudied
-
-PARAGRAPH 3 (OPTIONAL) - FUTURE RESEARCH DIRECTIONS:
-- Suggest concrete directions for future investigation
-- Connect suggestions explicitly to the identified gaps
-- Base suggestions on limitations found in reviewed papers
-- Be specific and actionable
-
-CRITICAL REQUIREMENTS:
-- Use formal academic English
-- Keep within 200-350 words
-- Be concise and substantive
-- Every major finding must have a citation
-- End with a clear forward-looking statement grounded in literature
-- Use hedging language: suggests, may, appears, indicates
-- NO unsupported assertions""")
-        ])
-
         try:
-            chain = conclusion_prompt | self.llm
-            response = await asyncio.wait_for(
-                chain.ainvoke({
-                    "query": query,
-                    "themes": "\n- ".join(synthesis.get("main_themes", [])),
-                    "contributions": "\n- ".join(synthesis.get("top_contributions", [])),
-                    "gaps": "\n- ".join(synthesis.get("research_gaps", [])),
-                    "methodologies": "\n- ".join(synthesis.get("methodologies", [])),
-                    "paper_references": paper_references
-                }),
-                timeout=LLM_CALL_TIMEOUT
-            )
-            return response.content.strip()
+            return await self._invoke_section("conclusion", CONCLUSION_PROMPT, {
+                "query": query,
+                "themes": "\n- ".join(synthesis.get("main_themes", [])),
+                "contributions": "\n- ".join(synthesis.get("top_contributions", [])),
+                "gaps": "\n- ".join(synthesis.get("research_gaps", [])),
+                "methodologies": "\n- ".join(synthesis.get("methodologies", [])),
+                "paper_references": paper_references
+            }, use_cache, model=CONCLUSION_MODEL,
+                revision_prompt=CONCLUSION_REGENERATION_PROMPT, revision_feedback=revision_feedback)
         except Exception as e:
+            self.section_cache_keys.pop("conclusion", None)  # The placeholder must not be cached
             return f"Conclusion could not be generated: {str(e)}"
 
+    @staticmethod
+    def _quality_feedback(quality_result: Dict[str, Any]) -> str:
+        """Describe a failed quality assessment for a regeneration prompt"""
+        lines = [
+            f"- Quality score {quality_result.get('overall_score', 0):.1f}/10 is below the required {MIN_QUALITY_SCORE}"
+        ]
+        lines += [f"- {issue}" for issue in quality_result.get("issues", [])[:MAX_REVISION_ITEMS]]
+        return "\n".join(lines)
+
+    @staticmethod
+    def _citation_feedback(citation_result: Any, paper_references: str) -> str:
+        """Describe failed citations, and restate the valid references, for a regeneration prompt"""
+        lines = [
+            f"- Citation {citation} matches no paper in the references"
+            for citation in citation_result.orphan_citations[:MAX_REVISION_ITEMS]
+        ]
+        lines += [
+            f"- Citation {citation} does not match its reference: {reference}"
+            for citation, reference in citation_result.citation_mismatches[:MAX_REVISION_ITEMS]
+        ]
+        lines.append(
+            "\nCite ONLY these papers, with author names and years exactly as listed:\n" + paper_references
+        )
+        return "\n".join(lines)
+
+    @staticmethod
+    def _fact_check_feedback(fact_check_result: Dict[str, Any]) -> str:
+        """Describe claims that fact-checking could not support, for a regeneration prompt"""
+        unsupported = [
+            v for v in fact_check_result.get("verifications", [])
+            if v.get("verdict") == "NOT_SUPPORTED"
+        ][:MAX_REVISION_ITEMS]
+        lines = [
+            f"- {v['claim']} {v.get('citation', '')}: {v.get('reasoning') or 'not supported by the cited paper'}"
+            for v in unsupported
+        ]
+        lines.append(
+            "Remove these claims, or restate them so they match what the cited papers report, with hedged wording."
+        )
+        return "\n".join(lines)
+
     def _compile_audio_essay(
         self,
         introduction: str,
@@ -863,13 +1091,118 @@ CRITICAL REQUIREMENTS:
 
         return audio_essay.strip()
 
+    async def _repair_citations(
+        self,
+        sections: Dict[str, str],
+        citation_result: Any,
+        paper_references: str
+    ) -> Optional[Dict[str, str]]:
+        """
+        Rewrite only the sentences whose citations failed verification
+
+        Args:
+            sections: Current essay sections by name
+            citation_result: Failed CitationVerificationResult
+            paper_references: Formatted reference data for citations
+
+        Returns:
+            Sections with corrected sentences spliced in, or None if no repair was applied
+        """
+        bad_citations = list(dict.fromkeys(
+            citation_result.orphan_citations
+            + [citation for citation, _ in citation_result.citation_mismatches]
+        ))
+        sentences = list(dict.fromkeys(
+            sentence
+            for name in ESSAY_SECTIONS
+            for sentence in self.citation_verifier.sentences_citing(sections[name], bad_citations)
+        ))
+        if not sentences:
+            return None
+
+        try:
+            response = await asyncio.wait_for(
+                self._citation_repair_chain.ainvoke({
+                    "bad_citations": "\n".join(bad_citations),
+                    "paper_references": paper_references,
+                    "sentences": dumps(sentences)
+                }),
+                timeout=LLM_CALL_TIMEOUT
+            )
+            corrections = loads(response.content)
+        except Exception as e:
+            self._safe_print(f"[Summarizer] Citation repair error: {str(e)}")
+            return None
+
+        if not isinstance(corrections, dict):
+            return None
+
+        repaired = dict(sections)
+        applied = 0
+        for old, new in corrections.items():
+            # Only accept edits to sentences that were sent for repair
+            if old not in sentences or not isinstance(new, str) or not new.strip() or new == old:
+                continue
+            for name in ESSAY_SECTIONS:
+                if old in repaired[name]:
+                    repaired[name] = repaired[name].replace(old, new)
+                    applied += 1
+
+        if not applied:
+            return None
+
+        self._safe_print(f"[Summarizer] Repaired citations in {applied} sentence(s)")
+        return repaired
+
+    def _format_references(self, analyses: List[Dict[str, Any]]) -> str:
+        """
+        Format the numbered reference list from the analyses' citations
+
+        Returns:
+            Reference entries, each followed by a blank line
+        """
+        parts = []
+        for i, analysis in enumerate(analyses, 1):
+            # Try to get citation info from the analysis structure
+            citations = analysis.get("citations")
+            if citations:
+                citation = citations[0]
+                title = citation.get("title", "Unknown Title")
+                authors = citation.get("authors", "Authors not specified")
+                year = citation.get("year", "Year not specified")
+                url = citation.get("source", "")
+                has_authors = authors != _NOT_PROVIDED
+                has_year = year != _NOT_PROVIDED
+
+                # Format citation
+                if has_authors and has_year:
+                    parts.append(f"{i}. {authors} ({year}). {title}\n")
+                else:
+                    parts.append(f"{i}. {title}\n")
+                    if has_authors:
+                        parts.append(f"   Authors: {authors}\n")
+                    if has_year:
+                        parts.append(f"   Year: {year}\n")
+            else:
+                # Fallback to analysis-level data
+                title = analysis.get("title", analysis.get("summary", "Unknown Title")[:100])
+                parts.append(f"{i}. {title}\n")
+                url = analysis.get("source_url", "")
+
+            if url:
+                parts.append(f"   URL: {url}\n")
+            parts.append("\n")
+
+        return "".join(parts)
+
     def _compile_essay(
         self,
         query: str,
         introduction: str,
         body: str,
         conclusion: str,
-        analyses: List[Dict[str, Any]]
+        analyses: List[Dict[str, Any]],
+        generated_at: datetime
     ) -> tuple:
         """
         Compile all sections into final essay - both visual and audio versions
@@ -877,7 +1210,8 @@ CRITICAL REQUIREMENTS:
         Returns:
             Tuple of (visual_essay, audio_essay)
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = generated_at.strftime("%Y-%m-%d %H:%M:%S")
+        references = self._format_references(analyses)
 
         visual_essay = f"""# Research Essay: {query}
 
@@ -907,80 +1241,61 @@ CRITICAL REQUIREMENTS:
 
 ## References
 
-"""
-        # Add references - extract from citations in each analysis
-        for i, analysis in enumerate(analyses, 1):
-            # Try to get citation info from the analysis structure
-            citations = analysis.get("citations", [])
-            if citations and len(citations) > 0:
-                citation = citations[0]
-                title = citation.get("title", "Unknown Title")
-                authors = citation.get("authors", "Authors not specified")
-                year = citation.get("year", "Year not specified")
-                url = citation.get("source", "")
-
-                # Format citation
-                if authors != "Information not provided in abstract" and year != "Information not provided in abstract":
-                    visual_essay += f"{i}. {authors} ({year}). {title}\n"
-                else:
-                    visual_essay += f"{i}. {title}\n"
-                    if authors != "Information not provided in abstract":
-                        visual_essay += f"   Authors: {authors}\n"
-                    if year != "Information not provided in abstract":
-                        visual_essay += f"   Year: {year}\n"
-            else:
-                # Fallback to analysis-level data
-                title = analysis.get("title", analysis.get("summary", "Unknown Title")[:100])
-                visual_essay += f"{i}. {title}\n"
-                url = analysis.get("source_url", "")
-
-            if url:
-                visual_essay += f"   URL: {url}\n"
-            visual_essay += "\n"
+{references}
+---
 
-        visual_essay += f"\n---\n\n*This essay was generated by AURA - Autonomous Unified Research Assistant*\n"
-        visual_essay += f"*Generated with Claude Code (https://claude.com/claude-code)*\n"
+*This essay was generated by AURA - Autonomous Unified Research Assistant*
+*Generated with Claude Code (https://claude.com/claude-code)*
+"""
 
         # AUDIO VERSION (for ElevenLabs) - clean prose only
         audio_essay = self._compile_audio_essay(introduction, body, conclusion)
 
         return visual_essay, audio_essay
 
-    def _save_essay(self, query: str, essay: str) -> str:
-        """Save essay to .txt file"""
+    async def _save_essay(self, query: str, essay: str, timestamp: Optional[str] = None) -> str:
+        """Save essay to .txt file (and a .md copy) without blocking the event loop"""
         try:
-            # Create filename from query
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_query = "".join(c if c.isalnum() or c in (' ', '-') else '' for c in query)
+            # Create filename from query (timestamp defaults to now)
+            timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+            safe_query = _UNSAFE_FILENAME_CHARS.sub('', query)
             safe_query = safe_query.replace(' ', '_')[:50]  # Limit length
 
             # Save as .txt file as specified
             filename = f"essay_{safe_query}_{timestamp}.txt"
             file_path = Path(ESSAYS_DIR) / filename
 
-            # Save essay with proper UTF-8 encoding
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(essay)
-
-            self._safe_print(f"[Summarizer] Essay saved to: {file_path}")
-
             # Also save markdown version for better formatting
             md_filename = f"essay_{safe_query}_{timestamp}.md"
             md_file_path = Path(ESSAYS_DIR) / md_filename
-            with open(md_file_path, 'w', encoding='utf-8') as f:
-                f.write(essay)
 
+            # Save essay with proper UTF-8 encoding in a worker thread; the .md copy is a
+            # hard link to the same data, written out only where links are unsupported
+            def write_files():
+                data = essay.encode('utf-8')
+                file_path.write_bytes(data)
+                try:
+                    os.link(file_path, md_file_path)
+                except OSError:
+                    md_file_path.write_bytes(data)
+
+            await asyncio.to_thread(write_files)
+
+            self._safe_print(f"[Summarizer] Essay saved to: {file_path}")
             self._safe_print(f"[Summarizer] Markdown version saved to: {md_file_path}")
 
             return str(file_path)
         except Exception as e:
-            import logging
-            logger = logging.getLogger('aura.summarizer')
             logger.error(f"Error saving essay: {e}")
             # Return a default path even if save fails
             return str(Path(ESSAYS_DIR) / f"essay_error_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
 
-    def _generate_metadata(self, essay: str, analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _generate_metadata(
+        self,
+        essay: str,
+        analyses: List[Dict[str, Any]],
+        generated_at: datetime
+    ) -> Dict[str, Any]:
         """Generate essay metadata"""
         word_count = len(essay.split())
         citations = len(analyses)
@@ -989,5 +1304,5 @@ CRITICAL REQUIREMENTS:
             "word_count": word_count,
             "citations": citations,
             "papers_synthesized": len(analyses),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": generated_at.isoformat()
         }
@@ -6,13 +6,14 @@ Orchestrates the research workflow and coordinates subordinate agents
 from typing import Dict, Any, List
 import asyncio
 from datetime import datetime
-import requests
+import httpx
 import logging
 import time
 from functools import wraps
 from .base_agent import BaseAgent, AgentStatus
 from .subordinate_agent import SubordinateAgent
 from ..utils.config import SERPER_API_KEY, TAVILY_API_KEY, MAX_SUBORDINATE_AGENTS, BATCH_SIZE, ALLOW_MOCK_DATA
+from ..utils.llm_cache import LLMCache
 from ..services.paper_validation_service import PaperValidationService
 from ..services.source_sufficiency_service import SourceSufficiencyService
 from ..services.topic_classification_service import TopicClassificationService
@@ -60,6 +61,10 @@ class SupervisorAgent(BaseAgent):
     Orchestrator agent that coordinates the entire research workflow
     """
 
+    # Serper results cache (shared across runs, a new supervisor is created per request)
+    SEARCH_CACHE_TIMEOUT_HOURS = 24
+    _search_cache = LLMCache(maxsize=256, ttl_hours=SEARCH_CACHE_TIMEOUT_HOURS)
+
     def __init__(self):
         super().__init__(
             agent_id="supervisor-001",
@@ -143,6 +148,7 @@ class SupervisorAgent(BaseAgent):
     async def _fetch_papers_api(self, query: str) -> List[Dict[str, Any]]:
         """
         Internal method to fetch papers from Serper API with retry support.
+        Results are cached per query for SEARCH_CACHE_TIMEOUT_HOURS.
 
         Args:
             query: Search query
@@ -153,6 +159,12 @@ class SupervisorAgent(BaseAgent):
         Raises:
             Exception: If API call fails after all retries
         """
+        cache_key = query.strip().lower()
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached Serper results for query: {query}")
+            return [dict(paper) for paper in cached]
+
         url = "https://google.serper.dev/scholar"
 
         payload = {
@@ -167,12 +179,8 @@ class SupervisorAgent(BaseAgent):
 
         logger.info(f"Fetching papers from Serper API for query: {query}")
 
-        # Run sync request in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: requests.post(url, json=payload, headers=headers, timeout=30)
-        )
+        async with httpx.AsyncClient(timeout=30) as client:
+            response = await client.post(url, json=payload, headers=headers)
 
         response.raise_for_status()
 
@@ -212,7 +220,11 @@ class SupervisorAgent(BaseAgent):
             })
 
         logger.info(f"Successfully fetched {len(papers)} papers from Serper API")
-        return papers
+
+        if papers:
+            self._search_cache.set(cache_key, papers)
+
+        return [dict(paper) for paper in papers]
 
     @retry_with_backoff(retries=3, backoff_factor=2.0)
     async def _fetch_papers_tavily(self, query: str) -> List[Dict[str, Any]]:
@@ -7,8 +7,6 @@ from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 import asyncio
 from datetime import datetime
-import sys
-import io
 from ..utils.config import (
     NODE_TIMEOUT_FETCH_PAPERS,
     NODE_TIMEOUT_EXECUTE_AGENTS,
@@ -80,13 +78,6 @@ class ResearchWorkflow:
         self.summarizer = summarizer_agent
         self.graph = self._build_graph()
 
-        # Configure stdout for UTF-8 encoding on Windows
-        if sys.stdout.encoding != 'utf-8':
-            try:
-                sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-            except Exception as e:
-                pass  # Fallback to default encoding if reconfiguration fails
-
     def _safe_print(self, message: str):
         """Safely print message with Unicode encoding error handling"""
         try:
@@ -5,10 +5,9 @@ Generates intelligent, novel research questions from completed research analyses
 
 from typing import Dict, Any, List
 import asyncio
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 import json
-from ..utils.config import OPENAI_API_KEY, GPT_MODEL
+from ..utils.llm_client import get_llm
 
 
 class QuestionGenerator:
@@ -17,11 +16,7 @@ class QuestionGenerator:
     """
 
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model=GPT_MODEL,
-            api_key=OPENAI_API_KEY,
-            temperature=0.7  # Higher for creativity
-        )
+        self.llm = get_llm(0.7)  # Higher for creativity
 
         # Question type templates
         self.question_types = {
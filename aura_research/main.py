@@ -10,11 +10,16 @@ from slowapi.errors import RateLimitExceeded
 from fastapi.responses import JSONResponse
 from .routes import chat, research, graph, ideation, auth
 from .utils.config import validate_env_vars
+from .utils.console import configure_utf8_stdout
 from .utils.logging_config import setup_logging, get_logger
 from .utils.rate_limiter import limiter
+from .utils.llm_client import close_llm_clients
 from .database.connection import get_db_connection
 import uvicorn
 
+# Agents print non-ASCII progress output; make stdout UTF-8 before anything logs
+configure_utf8_stdout()
+
 # Setup structured logging
 setup_logging()
 logger = get_logger('aura.api')
@@ -155,6 +160,7 @@ async def shutdown_event():
         logger.info("[AURA] Database connection closed")
     except Exception:
         pass
+    await close_llm_clients()
     logger.info("[AURA] Backend server shutting down")
 
 if __name__ == "__main__":
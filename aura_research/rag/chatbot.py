@@ -4,14 +4,14 @@ Uses GPT-4o with ReAct reasoning pattern
 """
 
 from typing import Dict, Any, List, Optional
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 from typing_extensions import TypedDict
 from .vector_store import VectorStoreManager
-from ..utils.config import OPENAI_API_KEY, GPT_MODEL
+from ..utils.llm_client import get_llm
+from ..utils.json_utils import loads
 
 
 class ChatState(TypedDict):
@@ -61,11 +61,7 @@ class RAGChatbot:
                 self.use_fallback = True
 
         # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=GPT_MODEL,
-            api_key=OPENAI_API_KEY,
-            temperature=0.7  # Slightly higher for conversational responses
-        )
+        self.llm = get_llm(0.7)  # Slightly higher for conversational responses
 
         # Initialize memory
         self.memory = MemorySaver()
@@ -91,18 +87,16 @@ class RAGChatbot:
         Returns:
             List of papers, empty list if not found
         """
-        import json
         from ..utils.config import ANALYSIS_DIR
 
         analysis_file = ANALYSIS_DIR / f"research_{session_id}.json"
 
         try:
             if analysis_file.exists():
-                with open(analysis_file, 'r') as f:
-                    data = json.load(f)
-                    papers = data.get("papers", [])
-                    print(f"[RAGChatbot] Loaded {len(papers)} papers from session data")
-                    return papers
+                data = loads(analysis_file.read_bytes())
+                papers = data.get("papers", [])
+                print(f"[RAGChatbot] Loaded {len(papers)} papers from session data")
+                return papers
         except Exception as e:
             print(f"[RAGChatbot] Error loading papers: {e}")
 
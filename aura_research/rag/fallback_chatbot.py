@@ -13,13 +13,13 @@ using domain knowledge and LLM reasoning.
 from typing import Dict, Any, List, Optional
 import json
 from pathlib import Path
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 from typing_extensions import TypedDict
-from ..utils.config import OPENAI_API_KEY, GPT_MODEL, ANALYSIS_DIR
+from ..utils.config import ANALYSIS_DIR
+from ..utils.llm_client import get_llm
 import logging
 
 logger = logging.getLogger('aura.rag')
@@ -66,11 +66,7 @@ class FallbackChatbot:
         )
 
         # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=GPT_MODEL,
-            api_key=OPENAI_API_KEY,
-            temperature=0.7
-        )
+        self.llm = get_llm(0.7)
 
         # Initialize memory
         self.memory = MemorySaver()
@@ -4,11 +4,11 @@ FAISS Vector Store Manager for AURA RAG System
 
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-import json
 from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 from ..utils.config import OPENAI_API_KEY, EMBEDDING_MODEL, VECTOR_STORE_DIR, ANALYSIS_DIR
+from ..utils.json_utils import loads
 import os
 
 
@@ -50,8 +50,7 @@ class VectorStoreManager:
 
             if analysis_file.exists():
                 print(f"[VectorStore] Loading from file: {analysis_file}")
-                with open(analysis_file, 'r', encoding='utf-8') as f:
-                    research_data = json.load(f)
+                research_data = loads(analysis_file.read_bytes())
             else:
                 # Fallback to database
                 print(f"[VectorStore] File not found, trying database for session: {session_id}")
@@ -3,12 +3,24 @@ AURA Services Module
 Business logic and service layer
 """
 
-from .db_service import DatabaseService
-from .auth_service import AuthService
-from .audio_service import AudioService
+from importlib import import_module
+
+# Re-exports resolve on first access, so importing one service module does not
+# pull in the database layer behind the others
+_EXPORTS = {
+    'DatabaseService': '.db_service',
+    'AuthService': '.auth_service',
+    'AudioService': '.audio_service'
+}
 
 __all__ = [
     'DatabaseService',
     'AuthService',
     'AudioService'
 ]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
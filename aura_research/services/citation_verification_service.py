@@ -30,6 +30,7 @@ class CitationVerificationService:
     # Citation format patterns
     CITATION_PATTERN = r'\(([^)]*et al\.|[^)]*),\s*(\d{4})\)'
     REFERENCE_SECTION_PATTERN = r'(?:^|\n)(References?|Bibliography|Citations?)\s*(?:\n|$)'
+    SENTENCE_END_PATTERN = r'(?<=[.!?])\s+'
 
     def __init__(self):
         """Initialize citation verification service with config threshold"""
@@ -128,6 +129,28 @@ class CitationVerificationService:
 
         return citations
 
+    def sentences_citing(self, text: str, citations: List[str]) -> List[str]:
+        """
+        Find the sentences of a text that contain any of the given citations
+
+        Each sentence's citations are extracted and normalized exactly as verify_citations
+        does, so a reported citation is found even when the text groups several citations
+        in one parenthetical or writes "et al" without a period.
+
+        Args:
+            text: Essay text or a single section of it
+            citations: Citations as reported in a CitationVerificationResult
+
+        Returns:
+            Matching sentences, in order and without duplicates
+        """
+        wanted = set(citations)
+        return list(dict.fromkeys(
+            sentence
+            for sentence in re.split(self.SENTENCE_END_PATTERN, text)
+            if any(citation["full"] in wanted for citation in self._extract_citations(sentence))
+        ))
+
     def _extract_references(self, essay: str) -> List[Dict[str, str]]:
         """
         Extract reference list from essay
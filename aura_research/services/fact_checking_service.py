@@ -7,13 +7,13 @@ import logging
 import re
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from ..utils.config import (
-    OPENAI_API_KEY, GPT_MODEL,
     FACT_CHECK_TOP_N_CLAIMS,
-    MIN_SUPPORTED_CLAIMS_PCT
+    MIN_SUPPORTED_CLAIMS_PCT,
+    LLM_CALL_TIMEOUT
 )
+from ..utils.llm_client import get_llm
 import asyncio
 
 logger = logging.getLogger('aura.services')
@@ -37,11 +37,7 @@ class FactCheckingService:
         """Initialize fact-checking service with LLM and config thresholds"""
         self.TOP_N_CLAIMS = FACT_CHECK_TOP_N_CLAIMS
         self.MIN_SUPPORTED_CLAIMS_PCT = MIN_SUPPORTED_CLAIMS_PCT
-        self.llm = ChatOpenAI(
-            model=GPT_MODEL,
-            api_key=OPENAI_API_KEY,
-            temperature=0.1  # Very precise
-        )
+        self.llm = get_llm(0.1)  # Very precise
         logger.debug(f"Loaded fact-checking config: top_n={self.TOP_N_CLAIMS}, min_pct={self.MIN_SUPPORTED_CLAIMS_PCT*100:.1f}%")
 
     async def verify_essay_claims(
@@ -79,7 +75,8 @@ class FactCheckingService:
         selected_claims = claims[:self.TOP_N_CLAIMS]
         logger.info(f"Verifying {len(selected_claims)} top claims")
 
-        # Verify each claim in parallel
+        # Verify each claim in parallel (each LLM call has its own timeout, so
+        # one slow claim degrades alone instead of stalling the batch)
         verification_tasks = [
             self._verify_single_claim(claim, analyses)
             for claim in selected_claims
@@ -222,15 +219,15 @@ REASONING: [explanation]
         chain = verification_prompt | self.llm
 
         try:
-            response = await asyncio.to_thread(
-                chain.invoke,
-                {
+            response = await asyncio.wait_for(
+                chain.ainvoke({
                     "claim": claim,
                     "title": paper_title,
                     "methodology": methodology[:500],  # Limit length
                     "findings": findings[:500],
                     "conclusions": conclusions[:500]
-                }
+                }),
+                timeout=LLM_CALL_TIMEOUT
             )
 
             # Parse response
@@ -10,7 +10,7 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import json
-from ..utils.config import ABSTRACT_MIN_LENGTH
+from ..utils.config import ABSTRACT_MIN_LENGTH, MAX_CONCURRENT_FETCH
 
 logger = logging.getLogger('aura.services')
 
@@ -68,7 +68,7 @@ class PaperValidationService:
                 logger.debug(f"First paper value: {str(first_paper)[:100]}")
 
         # Run validations in parallel with semaphore to respect API limits
-        semaphore = asyncio.Semaphore(5)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCH)
         tasks = [
             self._validate_paper(paper, semaphore)
             for paper in papers
@@ -44,10 +44,16 @@ DB_DRIVER = os.getenv("DB_DRIVER", "{ODBC Driver 17 for SQL Server}")
 # Agent Configuration
 MAX_SUBORDINATE_AGENTS = 5
 BATCH_SIZE = 10  # Papers per agent
+MAX_CONCURRENT_ANALYSES = 8  # Concurrent paper analysis LLM calls per analyst agent
+PAPERS_PER_ANALYSIS_CALL = 1  # Papers combined into one analysis LLM call (1 = one call per paper)
+MIN_SNIPPET_LENGTH_FOR_ANALYSIS = 80  # Shorter abstracts get a stub analysis instead of an LLM call
 
 # Model Configuration
 GPT_MODEL = "gpt-4o"
+# Essay conclusions are short and tightly structured; set to a smaller model to cut cost/latency
+CONCLUSION_MODEL = os.getenv("AURA_CONCLUSION_MODEL", GPT_MODEL)
 EMBEDDING_MODEL = "text-embedding-3-small"
+SYNTHESIS_MAX_INPUT_TOKENS = 60000  # Budget for paper analyses in the synthesis prompt
 
 # RAG Configuration
 VECTOR_STORE_PATH = str(VECTOR_STORE_DIR / "faiss_index")
@@ -61,6 +67,7 @@ OPENALEX_API_URL = "https://api.openalex.org/works"
 MIN_VALID_PAPERS = 4
 ABSTRACT_MIN_LENGTH = 30  # Minimum abstract length in characters
 VALIDATION_CACHE_HOURS = 24
+MAX_CONCURRENT_FETCH = int(os.getenv("AURA_MAX_CONCURRENT_FETCH", "5"))  # In-flight validation API requests
 
 # Source Sufficiency
 MIN_UNIQUE_VENUES = 2
@@ -96,6 +103,11 @@ NODE_TIMEOUT_EXECUTE_AGENTS = 180  # 3 minutes for agent execution
 NODE_TIMEOUT_SYNTHESIZE_ESSAY = 120  # 2 minutes for essay synthesis
 LLM_CALL_TIMEOUT = 60  # 1 minute per individual LLM call
 GRACEFUL_DEGRADATION_THRESHOLD = 240  # 4 minutes (start wrapping up)
+LLM_MAX_RETRIES = 2  # OpenAI SDK retries per request (connection errors, 429, 5xx)
+
+# LLM Output Limits (tokens)
+SYNTHESIS_MAX_OUTPUT_TOKENS = 4096  # Structured synthesis JSON
+SECTION_MAX_OUTPUT_TOKENS = 1536  # Essay sections target 150-900 words
 
 def get_storage_paths():
     """Return all storage paths as a dictionary"""
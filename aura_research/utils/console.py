@@ -0,0 +1,19 @@
+"""
+Console setup for AURA
+Makes stdout safe for the emoji and non-ASCII text agents print
+"""
+
+import sys
+
+
+def configure_utf8_stdout() -> None:
+    """
+    Reconfigure stdout to UTF-8 in place (Windows consoles default to a legacy code page)
+
+    Call once at process startup; unencodable characters are replaced instead of raising.
+    """
+    if sys.stdout.encoding and sys.stdout.encoding.lower() != 'utf-8':
+        try:
+            sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        except Exception:
+            pass  # Fallback to default encoding if reconfiguration fails
@@ -0,0 +1,59 @@
+"""
+JSON helpers for AURA
+Parses and serializes JSON, using orjson when it is installed
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Any) -> Any:
+    """
+    Deserialize JSON from str or bytes
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON
+            (orjson.JSONDecodeError is a subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 encoded JSON, ready to write to disk in one call
+
+    Args:
+        obj: Value to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize to a JSON string (non-ASCII characters are kept as UTF-8)
+
+    Args:
+        obj: Value to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return dumps_bytes(obj, indent).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
@@ -0,0 +1,92 @@
+"""
+LLM response cache for AURA
+In-process, content-addressed cache for deterministic (low temperature) LLM calls
+"""
+
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Optional, Sequence, Tuple
+
+from .json_utils import dumps
+
+# Calls sampled at or above this temperature are too varied to be worth caching
+MAX_CACHEABLE_TEMPERATURE = 0.7
+
+
+def cache_key(model: str, temperature: float, messages: Sequence[Any]) -> str:
+    """
+    Content hash of an LLM call
+
+    Args:
+        model: Model name
+        temperature: Sampling temperature
+        messages: Rendered chat messages (anything with .type and .content)
+
+    Returns:
+        Hex digest identifying the exact request
+    """
+    payload = dumps({
+        "model": model,
+        "temperature": temperature,
+        "messages": [[message.type, message.content] for message in messages]
+    })
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def is_cacheable(temperature: float) -> bool:
+    """Whether responses sampled at this temperature may be served from cache"""
+    return temperature < MAX_CACHEABLE_TEMPERATURE
+
+
+class LLMCache:
+    """
+    Bounded LRU cache with per-entry expiry
+
+    Values are stored as given; callers that mutate cached dicts should copy them.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_hours: float = 24):
+        self.maxsize = maxsize
+        self.ttl = timedelta(hours=ttl_hours)
+        self._entries: "OrderedDict[str, Tuple[datetime, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        cached_at, value = entry
+        if datetime.now() - cached_at >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._entries[key] = (datetime.now(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,100 @@
+"""
+Shared OpenAI chat clients for AURA
+Agents and services reuse one HTTP client (pooled per event loop) instead of opening their own connections
+"""
+
+import asyncio
+from functools import lru_cache
+from typing import Dict, Optional
+
+import httpx
+from langchain_core.runnables import Runnable
+from langchain_openai import ChatOpenAI
+
+from .config import OPENAI_API_KEY, GPT_MODEL, LLM_CALL_TIMEOUT, LLM_MAX_RETRIES
+
+_HTTP_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+_http_async_client: Optional[httpx.AsyncClient] = None
+
+
+class _PerLoopTransport(httpx.AsyncBaseTransport):
+    """
+    Sends each request through a connection pool owned by the running event loop
+
+    A pool's connections and locks belong to the loop that opened them, so a pool
+    reused from a finished asyncio.run() loop fails with "Event loop is closed".
+    Pools of closed loops are dropped whenever a new loop opens its pool.
+    """
+
+    def __init__(self, limits: httpx.Limits):
+        self._limits = limits
+        self._pools: Dict[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = {}
+
+    def _pool(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            self._pools = {other: p for other, p in self._pools.items() if not other.is_closed()}
+            pool = self._pools[loop] = httpx.AsyncHTTPTransport(limits=self._limits)
+        return pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the current loop's pool (other loops' pools cannot be closed from here)"""
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        self._pools.clear()
+        if pool is not None:
+            await pool.aclose()
+
+
+def _get_http_async_client() -> httpx.AsyncClient:
+    """Process-wide async HTTP client (request timeouts are set per call by the OpenAI SDK)"""
+    global _http_async_client
+    if _http_async_client is None or _http_async_client.is_closed:
+        _http_async_client = httpx.AsyncClient(transport=_PerLoopTransport(_HTTP_POOL_LIMITS))
+    return _http_async_client
+
+
+@lru_cache(maxsize=None)
+def _get_base_llm(model: str) -> ChatOpenAI:
+    """The ChatOpenAI client (sync and async) that every get_llm() variant for a model wraps"""
+    return ChatOpenAI(
+        model=model,
+        api_key=OPENAI_API_KEY,
+        # Bound every request, including sync invokes run in worker threads that
+        # asyncio.wait_for cannot cancel
+        timeout=LLM_CALL_TIMEOUT,
+        max_retries=LLM_MAX_RETRIES,
+        http_async_client=_get_http_async_client()
+    )
+
+
+@lru_cache(maxsize=None)
+def get_llm(temperature: float, model: str = GPT_MODEL) -> Runnable:
+    """
+    Chat model at the given temperature (GPT_MODEL unless another model is named)
+
+    Every temperature is a binding over one ChatOpenAI client per model, and all
+    models share one connection pool per event loop; bindings are cached per (temperature, model).
+
+    Args:
+        temperature: Sampling temperature
+        model: OpenAI chat model name
+
+    Returns:
+        Shared chat model runnable (supports invoke/ainvoke, bind and | composition)
+    """
+    return _get_base_llm(model).bind(temperature=temperature)
+
+
+async def close_llm_clients() -> None:
+    """Close the shared HTTP client and this loop's connection pool (call on application shutdown)"""
+    global _http_async_client
+    get_llm.cache_clear()
+    _get_base_llm.cache_clear()
+    if _http_async_client is not None:
+        await _http_async_client.aclose()
+        _http_async_client = None
@@ -0,0 +1,57 @@
+"""
+Prompt token budgeting for AURA
+Counts prompt tokens with tiktoken and trims analysis lists to fit a budget
+"""
+
+from functools import lru_cache
+from typing import Any, List, Sequence
+
+from .config import GPT_MODEL
+from .json_utils import dumps
+
+
+@lru_cache(maxsize=1)
+def _token_encoding():
+    """Tokenizer for GPT_MODEL, or None if tiktoken cannot provide one"""
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model(GPT_MODEL)
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Prompt tokens in text (approximated at 4 characters per token without tiktoken)"""
+    encoding = _token_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
+
+
+def fit_to_token_budget(items: List[Any], budget: int, scores: Sequence[Any]) -> List[Any]:
+    """
+    Keep the highest-scoring items whose compact JSON fits within a token budget
+
+    Args:
+        items: JSON-serializable items destined for a prompt
+        budget: Maximum tokens for the serialized list
+        scores: Priority per item (non-numeric scores count as 0)
+
+    Returns:
+        Items that fit, in their original order (all of them if already within budget)
+    """
+    if count_tokens(dumps(items)) <= budget:
+        return list(items)
+
+    def score(index: int) -> float:
+        value = scores[index]
+        return float(value) if isinstance(value, (int, float)) else 0.0
+
+    kept = set()
+    used = 2  # Enclosing brackets
+    for index in sorted(range(len(items)), key=score, reverse=True):
+        cost = count_tokens(dumps(items[index])) + 1
+        if used + cost <= budget:
+            kept.add(index)
+            used += cost
+    return [item for index, item in enumerate(items) if index in kept]
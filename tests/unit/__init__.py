@@ -0,0 +1 @@
+"""Unit tests package."""
@@ -0,0 +1,56 @@
+"""
+Unit tests for the analyst retry backoff schedule
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from aura_research.agents import subordinate_agent
+from aura_research.agents.subordinate_agent import (
+    API_ERROR_WAIT_TIME,
+    BASE_WAIT_TIME,
+    MAX_WAIT_TIME,
+    _backoff_delay
+)
+
+
+@pytest.fixture
+def max_jitter(monkeypatch):
+    """Make the jitter deterministic by always drawing its upper bound"""
+    monkeypatch.setattr(subordinate_agent.random, "uniform", lambda low, high: high)
+
+
+def _error(retry_after):
+    return SimpleNamespace(response=SimpleNamespace(headers={"retry-after": retry_after}))
+
+
+@pytest.mark.unit
+class TestBackoffDelay:
+    def test_rate_limit_ceiling_doubles_until_cap(self, max_jitter):
+        delays = [_backoff_delay(attempt, BASE_WAIT_TIME) for attempt in range(5)]
+        assert delays == [10, 20, 40, 60, 60]
+
+    def test_api_error_ceiling_doubles_until_cap(self, max_jitter):
+        delays = [_backoff_delay(attempt, API_ERROR_WAIT_TIME) for attempt in range(6)]
+        assert delays == [5, 10, 20, 40, 60, 60]
+
+    def test_first_retry_backs_off_below_cap(self):
+        assert BASE_WAIT_TIME < MAX_WAIT_TIME
+
+    def test_jitter_stays_within_ceiling(self):
+        for attempt in range(6):
+            delay = _backoff_delay(attempt, BASE_WAIT_TIME)
+            assert 0 <= delay <= min(BASE_WAIT_TIME * 2 ** attempt, MAX_WAIT_TIME)
+
+    def test_retry_after_header_honored(self, max_jitter):
+        assert _backoff_delay(0, BASE_WAIT_TIME, _error("30")) == 31
+
+    def test_retry_after_header_capped(self, max_jitter):
+        assert _backoff_delay(0, BASE_WAIT_TIME, _error("600")) == MAX_WAIT_TIME
+
+    def test_unparseable_retry_after_falls_back_to_backoff(self, max_jitter):
+        assert _backoff_delay(1, BASE_WAIT_TIME, _error("soon")) == 20
+
+    def test_error_without_response_uses_backoff(self, max_jitter):
+        assert _backoff_delay(2, BASE_WAIT_TIME, ValueError("boom")) == 40
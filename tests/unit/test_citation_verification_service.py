@@ -0,0 +1,46 @@
+"""
+Unit tests for finding the sentences that carry failed citations
+"""
+
+import pytest
+
+from aura_research.services.citation_verification_service import CitationVerificationService
+
+
+@pytest.fixture
+def verifier():
+    return CitationVerificationService()
+
+
+def _reported(verifier, text):
+    """Citations as verify_citations would report them for this text"""
+    return [citation["full"] for citation in verifier._extract_citations(text)]
+
+
+@pytest.mark.unit
+class TestSentencesCiting:
+    def test_single_citation(self, verifier):
+        text = "Transformers dominate NLP (Smith et al., 2020). Other work differs (Lee, 2019)."
+        assert verifier.sentences_citing(text, ["(Smith et al., 2020)"]) == [
+            "Transformers dominate NLP (Smith et al., 2020)."
+        ]
+
+    def test_multi_citation_parenthetical(self, verifier):
+        sentence = "Both approaches improve recall (A et al., 2020; B, 2021)."
+        text = f"An unrelated opening (Lee, 2019). {sentence}"
+        reported = _reported(verifier, sentence)
+        # The reported form does not occur verbatim in the sentence
+        assert all(citation not in sentence for citation in reported)
+        assert verifier.sentences_citing(text, reported) == [sentence]
+
+    def test_et_al_without_period(self, verifier):
+        sentence = "Attention scales poorly (Smith et al, 2020)."
+        assert verifier.sentences_citing(sentence, ["(Smith et al., 2020)"]) == [sentence]
+
+    def test_other_citations_ignored(self, verifier):
+        text = "Results vary (Lee, 2019). Gains are modest (Smith et al., 2021)."
+        assert verifier.sentences_citing(text, ["(Smith et al., 2020)"]) == []
+
+    def test_duplicate_sentences_returned_once(self, verifier):
+        sentence = "Results vary (Lee, 2019)."
+        assert verifier.sentences_citing(f"{sentence} {sentence}", ["(Lee, 2019)"]) == [sentence]
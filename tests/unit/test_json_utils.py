@@ -0,0 +1,61 @@
+"""
+Unit tests for the orjson-backed JSON helpers
+"""
+
+import json
+
+import pytest
+
+from aura_research.utils import json_utils
+
+SAMPLE = {
+    "title": "Résumé of results",
+    "authors": ["Smith", "Lee"],
+    "scores": {"relevance": 0.9, "novelty": 7},
+    "empty_list": [],
+    "empty_dict": {},
+    "flag": True,
+    "missing": None
+}
+
+
+@pytest.fixture
+def stdlib_only(monkeypatch):
+    """Force the stdlib json fallback"""
+    monkeypatch.setattr(json_utils, "orjson", None)
+
+
+@pytest.mark.unit
+class TestJsonUtils:
+    """Serialization round-trips and orjson/stdlib parity"""
+
+    def test_round_trip(self):
+        assert json_utils.loads(json_utils.dumps(SAMPLE)) == SAMPLE
+        assert json_utils.loads(json_utils.dumps_bytes(SAMPLE)) == SAMPLE
+
+    def test_round_trip_stdlib(self, stdlib_only):
+        assert json_utils.loads(json_utils.dumps(SAMPLE)) == SAMPLE
+        assert json_utils.loads(json_utils.dumps_bytes(SAMPLE)) == SAMPLE
+
+    def test_non_ascii_kept_as_utf8(self, stdlib_only):
+        assert "Résumé" in json_utils.dumps(SAMPLE)
+        assert "Résumé".encode("utf-8") in json_utils.dumps_bytes(SAMPLE)
+
+    def test_indented_output_matches_stdlib(self, monkeypatch):
+        pytest.importorskip("orjson")
+        fast = json_utils.dumps_bytes(SAMPLE, indent=True)
+        monkeypatch.setattr(json_utils, "orjson", None)
+        assert fast == json_utils.dumps_bytes(SAMPLE, indent=True)
+
+    def test_dumps_is_decoded_dumps_bytes(self):
+        assert json_utils.dumps(SAMPLE, indent=True) == json_utils.dumps_bytes(SAMPLE, indent=True).decode("utf-8")
+
+    def test_loads_accepts_bytes_and_str(self):
+        assert json_utils.loads(b'{"a": 1}') == json_utils.loads('{"a": 1}') == {"a": 1}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_invalid_json_raises_decode_error(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(json_utils, "orjson", None)
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads("{not json")
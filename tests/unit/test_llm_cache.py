@@ -0,0 +1,102 @@
+"""
+Unit tests for the content-addressed LLM response cache
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from aura_research.utils.llm_cache import (
+    LLMCache,
+    MAX_CACHEABLE_TEMPERATURE,
+    cache_key,
+    is_cacheable
+)
+
+
+def _messages(*contents):
+    return [SimpleNamespace(type="human", content=content) for content in contents]
+
+
+@pytest.mark.unit
+class TestCacheKey:
+    """cache_key identifies the exact request"""
+
+    def test_same_request_same_key(self):
+        assert cache_key("gpt-4o", 0.2, _messages("hi")) == cache_key("gpt-4o", 0.2, _messages("hi"))
+
+    @pytest.mark.parametrize("model, temperature, contents", [
+        ("gpt-4o-mini", 0.2, ("hi",)),
+        ("gpt-4o", 0.3, ("hi",)),
+        ("gpt-4o", 0.2, ("hello",)),
+        ("gpt-4o", 0.2, ("hi", "again")),
+    ])
+    def test_any_difference_changes_key(self, model, temperature, contents):
+        assert cache_key("gpt-4o", 0.2, _messages("hi")) != cache_key(model, temperature, _messages(*contents))
+
+
+@pytest.mark.unit
+class TestIsCacheable:
+    """Only low-temperature calls are cacheable"""
+
+    def test_below_boundary(self):
+        assert is_cacheable(0.0)
+        assert is_cacheable(MAX_CACHEABLE_TEMPERATURE - 0.01)
+
+    def test_boundary_is_not_cacheable(self):
+        assert MAX_CACHEABLE_TEMPERATURE == 0.7
+        assert not is_cacheable(0.7)
+
+    def test_above_boundary(self):
+        assert not is_cacheable(1.0)
+
+
+@pytest.mark.unit
+class TestLLMCache:
+    """Bounded LRU with per-entry expiry"""
+
+    def test_get_returns_stored_value(self):
+        cache = LLMCache()
+        cache.set("k", {"v": 1})
+        assert cache.get("k") == {"v": 1}
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = LLMCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_overwrite_refreshes_recency(self):
+        cache = LLMCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+        cache.set("c", 3)
+
+        assert cache.get("a") == 10
+        assert cache.get("b") is None
+
+    def test_expired_entries_are_dropped(self):
+        cache = LLMCache(ttl_hours=0)
+        cache.set("k", "v")
+
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_unexpired_entries_are_kept(self):
+        cache = LLMCache(ttl_hours=1)
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+
+    def test_clear(self):
+        cache = LLMCache()
+        cache.set("k", "v")
+        cache.clear()
+        assert len(cache) == 0
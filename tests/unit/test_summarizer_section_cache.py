@@ -0,0 +1,82 @@
+"""
+Unit tests for which essay sections the summarizer may cache
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from aura_research.agents import summarizer_agent
+from aura_research.agents.summarizer_agent import ESSAY_SECTIONS, SummarizerAgent
+from aura_research.utils.llm_cache import LLMCache
+
+SYNTHESIS = {
+    "main_themes": ["Theme A"],
+    "key_findings": ["Finding A"],
+    "methodologies": ["Method A"],
+    "research_gaps": ["Gap A"],
+    "top_contributions": ["Contribution A"]
+}
+
+
+class FakeLLM:
+    """Answers every section prompt, except those containing a failing marker"""
+
+    def __init__(self, failing_marker=None):
+        self.failing_marker = failing_marker
+
+    async def ainvoke(self, messages):
+        if self.failing_marker and any(self.failing_marker in m.content for m in messages):
+            raise RuntimeError("LLM unavailable")
+        return SimpleNamespace(content="Generated section text (Smith et al., 2020).")
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """Summarizer without its services (section generation only needs the LLM)"""
+    monkeypatch.setattr(summarizer_agent, "CONCLUSION_MODEL", summarizer_agent.GPT_MODEL)
+    instance = SummarizerAgent.__new__(SummarizerAgent)
+    instance._section_cache = LLMCache()
+    instance.section_cache_keys = {}
+    return instance
+
+
+def _generate(agent, sections=None, names=ESSAY_SECTIONS):
+    return asyncio.run(agent._generate_sections(
+        names, "query", [{}], SYNTHESIS, "Smith et al. (2020)", sections
+    ))
+
+
+@pytest.mark.unit
+class TestSectionCacheKeys:
+    def test_keys_recorded_for_generated_sections(self, agent):
+        agent.llm = FakeLLM()
+        _generate(agent)
+        assert set(agent.section_cache_keys) == set(ESSAY_SECTIONS)
+
+    def test_failed_section_not_recorded(self, agent):
+        agent.llm = FakeLLM(failing_marker="Write the INTRODUCTION")
+        sections = _generate(agent)
+        assert sections["introduction"].startswith("Introduction could not be generated")
+        assert set(agent.section_cache_keys) == {"body", "conclusion"}
+
+    def test_failed_regeneration_drops_recorded_key(self, agent):
+        agent.llm = FakeLLM()
+        sections = _generate(agent)
+        agent.llm = FakeLLM(failing_marker="Write the BODY")
+        sections = _generate(agent, sections, names=("body",))
+        assert sections["body"].startswith("Body section could not be generated")
+        assert "body" not in agent.section_cache_keys
+        assert set(agent.section_cache_keys) == {"introduction", "conclusion"}
+
+    def test_cache_hit_recorded(self, agent):
+        agent.llm = FakeLLM()
+        _generate(agent)
+        for name, key in agent.section_cache_keys.items():
+            agent._section_cache.set(key, f"validated {name}")
+        agent.section_cache_keys = {}
+        agent.llm = FakeLLM(failing_marker="Write")
+        sections = _generate(agent)
+        assert sections == {name: f"validated {name}" for name in ESSAY_SECTIONS}
+        assert set(agent.section_cache_keys) == set(ESSAY_SECTIONS)
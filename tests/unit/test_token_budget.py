@@ -0,0 +1,64 @@
+"""
+Unit tests for prompt token budgeting
+"""
+
+import pytest
+
+from aura_research.utils import token_budget
+from aura_research.utils.json_utils import dumps
+from aura_research.utils.token_budget import count_tokens, fit_to_token_budget
+
+
+@pytest.fixture
+def approximate_tokens(monkeypatch):
+    """Use the 4-characters-per-token fallback so costs are predictable"""
+    monkeypatch.setattr(token_budget, "_token_encoding", lambda: None)
+
+
+@pytest.mark.unit
+class TestCountTokens:
+    """count_tokens with and without tiktoken"""
+
+    def test_fallback_approximation(self, approximate_tokens):
+        assert count_tokens("") == 1
+        assert count_tokens("a" * 40) == 11
+
+    def test_counts_grow_with_text(self):
+        assert count_tokens("word " * 100) > count_tokens("word " * 10)
+
+
+@pytest.mark.unit
+class TestFitToTokenBudget:
+    """fit_to_token_budget keeps the most relevant items that fit"""
+
+    def test_everything_fits(self, approximate_tokens):
+        items = ["a", "b", "c"]
+        assert fit_to_token_budget(items, 1000, [1, 2, 3]) == items
+
+    def test_keeps_original_order(self, approximate_tokens):
+        items = ["x" * 38, "y" * 38, "z" * 38]  # 12 tokens each, 2 for the brackets
+        kept = fit_to_token_budget(items, 26, [1, 3, 2])
+
+        assert kept == ["y" * 38, "z" * 38]
+
+    def test_fills_leftover_space_after_a_skipped_item(self, approximate_tokens):
+        big, small = "b" * 398, "s" * 38  # 102 and 12 tokens
+        items = [small, big, small + "t"]
+        budget = 2 + 102 + 12
+
+        # The big, highest-scoring item fits first; one small item still fits after it
+        kept = fit_to_token_budget(items, budget, [2, 3, 1])
+        assert kept == [small, big]
+
+        # When the big item does not fit, the smaller ones below it still do
+        kept = fit_to_token_budget(items, 30, [2, 3, 1])
+        assert kept == [small, small + "t"]
+
+    def test_non_numeric_scores_rank_last(self, approximate_tokens):
+        items = ["x" * 38, "y" * 38]
+        assert fit_to_token_budget(items, 14, [None, 0.5]) == ["y" * 38]
+
+    def test_result_fits_budget(self, approximate_tokens):
+        items = [{"summary": "w" * n} for n in range(10, 400, 30)]
+        kept = fit_to_token_budget(items, 150, list(range(len(items))))
+        assert count_tokens(dumps(kept)) <= 150